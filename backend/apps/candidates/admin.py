@@ -1,15 +1,29 @@
+from functools import partial
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 import logging
 from .models import Candidate, CandidateApplication
+from .services import CandidateCacheService
+from apps.common.admin import BadgeAdminMixin
 from apps.common.models import ActivityLog
 from apps.common.utils import get_client_ip
 
 logger = logging.getLogger(__name__)
 
+STATUS_BADGE_COLORS = {
+    'pending': '#FFA500',
+    'approved': '#28A745',
+    'rejected': '#DC3545',
+    'withdrawn': '#6C757D',
+}
+# Yes/no marks for boolean columns
+CHECK_MARK = format_html('<span style="color: {};">{}</span>', '#28A745', '✓')
+CROSS_MARK = format_html('<span style="color: {};">{}</span>', '#DC3545', '✗')
+
 
 @admin.register(CandidateApplication)
-class CandidateApplicationAdmin(admin.ModelAdmin):
+class CandidateApplicationAdmin(BadgeAdminMixin, admin.ModelAdmin):
     list_display = [
         'user', 'position', 'election', 'party', 
         'status_badge', 'submitted_at', 'reviewed_by'
@@ -17,10 +31,12 @@ class CandidateApplicationAdmin(admin.ModelAdmin):
     list_filter = ['status', 'election', 'position', 'party', 'submitted_at']
     search_fields = [
         'user__username', 'user__email', 'user__first_name', 'user__last_name',
-        'position__name', 'election__title', 'manifesto'
+        'position__name', 'election__title'
     ]
     ordering = ['-submitted_at']
     readonly_fields = ['submitted_at', 'reviewed_at']
+    badge_choices = CandidateApplication.APPLICATION_STATUS
+    badge_colors = STATUS_BADGE_COLORS
     
     fieldsets = (
         ('Application Info', {
@@ -36,18 +52,7 @@ class CandidateApplicationAdmin(admin.ModelAdmin):
     
     def status_badge(self, obj):
         """Display status with color badge"""
-        colors = {
-            'pending': '#FFA500',
-            'approved': '#28A745',
-            'rejected': '#DC3545',
-            'withdrawn': '#6C757D',
-        }
-        color = colors.get(obj.status, '#000000')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 3px;">{}</span>',
-            color,
-            obj.get_status_display()
-        )
+        return self.render_badge(obj.status)
     status_badge.short_description = 'Status'
     
     def save_model(self, request, obj, form, change):
@@ -212,7 +217,7 @@ class CandidateAdmin(admin.ModelAdmin):
     list_filter = ['is_active', 'election', 'position', 'party', 'created_at']
     search_fields = [
         'user__username', 'user__email', 'user__first_name', 'user__last_name',
-        'position__name', 'election__title', 'manifesto'
+        'position__name', 'election__title'
     ]
     ordering = ['election', 'position__display_order', 'user__first_name']
     readonly_fields = ['created_at', 'updated_at', 'approved_application']
@@ -232,23 +237,29 @@ class CandidateAdmin(admin.ModelAdmin):
     
     def has_photo(self, obj):
         """Display if candidate has a photo"""
-        return format_html(
-            '<span style="color: {};">{}</span>',
-            '#28A745' if obj.photo else '#DC3545',
-            '✓' if obj.photo else '✗'
-        )
+        return CHECK_MARK if obj.photo else CROSS_MARK
     has_photo.short_description = 'Photo'
     
     actions = ['activate_candidates', 'deactivate_candidates']
     
+    def _set_active(self, queryset, is_active):
+        """Update is_active and drop the cached by_election listings it affects"""
+        # Collected before the update, which may take rows out of a filtered queryset;
+        # update() sends no post_save, so the listing signal doesn't fire
+        election_ids = list(queryset.values_list('election_id', flat=True).distinct())
+        count = queryset.update(is_active=is_active)
+        for election_id in election_ids:
+            transaction.on_commit(partial(CandidateCacheService.invalidate, f"by_election:{election_id}"))
+        return count
+    
     def activate_candidates(self, request, queryset):
         """Bulk activate candidates"""
-        count = queryset.update(is_active=True)
+        count = self._set_active(queryset, True)
         self.message_user(request, f"{count} candidate(s) activated.")
     activate_candidates.short_description = "Activate selected candidates"
     
     def deactivate_candidates(self, request, queryset):
         """Bulk deactivate candidates"""
-        count = queryset.update(is_active=False)
+        count = self._set_active(queryset, False)
         self.message_user(request, f"{count} candidate(s) deactivated.")
     deactivate_candidates.short_description = "Deactivate selected candidates"
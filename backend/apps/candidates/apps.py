@@ -5,3 +5,7 @@ class CandidatesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.candidates'
     verbose_name = 'Candidates & Applications'
+    
+    def ready(self):
+        """Import signals when app is ready"""
+        import apps.candidates.signals
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-16 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def check_duplicate_approved_party_applications(apps, schema_editor):
+    """
+    Stop before adding the constraint if a party already has more than one
+    approved application for a position in an election (approve() did not
+    check this before). Those rows must be cleaned up by hand first, e.g. by
+    rejecting or withdrawing the extra applications and removing their candidates.
+    """
+    CandidateApplication = apps.get_model('candidates', 'CandidateApplication')
+    duplicates = (
+        CandidateApplication.objects.using(schema_editor.connection.alias)
+        .filter(status='approved', party__isnull=False)
+        .values('election_id', 'position_id', 'party_id')
+        .annotate(approved=models.Count('id'))
+        .filter(approved__gt=1)
+        .order_by('election_id', 'position_id', 'party_id')
+    )
+    if duplicates:
+        details = '; '.join(
+            f"election {row['election_id']}, position {row['position_id']}, "
+            f"party {row['party_id']}: {row['approved']} approved"
+            for row in duplicates
+        )
+        raise RuntimeError(
+            "Cannot add 'uniq_approved_party_per_position': some parties have more than one "
+            "approved application for the same position. Leave one approved application per "
+            f"party/position/election and reject the others, then migrate again. Duplicates: {details}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0001_initial'),
+        ('elections', '0005_schoolelection_is_paused'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_approved_party_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='candidateapplication',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'approved'), ('party__isnull', False)), fields=('position', 'election', 'party'), name='uniq_approved_party_per_position'),
+        ),
+    ]
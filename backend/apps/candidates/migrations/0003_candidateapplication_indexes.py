@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-16 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0002_approved_party_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['election', 'status'], name='candidates__electio_8851d9_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-16 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('candidates', '0003_candidateapplication_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['election', 'position', 'is_active'], name='candidates__electio_aad9f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['status', '-submitted_at'], name='candidates__status_421b5d_idx'),
+        ),
+    ]
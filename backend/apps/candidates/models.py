@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -32,14 +33,25 @@ class CandidateApplication(models.Model):
     
     def clean(self):
         """Validate application rules"""
-        
-        # Rule 1: Check if user already has any active application (pending/approved) for this election
+        self.validate_data(self.user, self.election, self.position, exclude_pk=self.pk)
+    
+    @classmethod
+    def validate_data(cls, user, election, position, exclude_pk=None):
+        """Validate application rules without building an instance"""
+        cls.validate_single_active_application(user, election, exclude_pk=exclude_pk)
+        # Rule 2 (one approved application per party per position) is enforced
+        # by the 'uniq_approved_party_per_position' constraint, see approve()
+        cls.validate_consecutive_terms(user, election, position)
+    
+    @staticmethod
+    def validate_single_active_application(user, election, exclude_pk=None):
+        """Rule 1: only one pending/approved application per user per election"""
         # Users can only have ONE application per election, regardless of position
         existing_application = CandidateApplication.objects.filter(
-            user=self.user,
-            election=self.election,
+            user=user,
+            election=election,
             status__in=['pending', 'approved']
-        ).exclude(pk=self.pk).first()
+        ).exclude(pk=exclude_pk).first()
         
         if existing_application:
             raise ValidationError(
@@ -47,39 +59,26 @@ class CandidateApplication(models.Model):
                 f"for {existing_application.position.name} in this election. "
                 f"Please withdraw your existing application first if you want to apply for a different position."
             )
-        
-        # Rule 2: Check if same party already has an approved application for this position
-        if self.party and self.status == 'approved':
-            existing_party_application = CandidateApplication.objects.filter(
-                position=self.position,
-                election=self.election,
-                party=self.party,
-                status='approved'
-            ).exclude(pk=self.pk).first()
-            
-            if existing_party_application:
-                raise ValidationError(
-                    f"Party '{self.party.name}' already has an approved candidate "
-                    f"({existing_party_application.user.get_full_name()}) for {self.position.name}."
-                )
-        
-        # Rule 3: Check if user ran for the same position in the previous election
-        if self.election and self.position:
+    
+    @staticmethod
+    def validate_consecutive_terms(user, election, position):
+        """Rule 3: a user cannot run for the same position in consecutive elections"""
+        if election and position:
             previous_election = SchoolElection.objects.filter(
-                start_date__lt=self.election.start_date
+                start_date__lt=election.start_date
             ).order_by('-start_date').first()
             
             if previous_election:
                 previous_candidate = Candidate.objects.filter(
-                    user=self.user,
-                    position=self.position,
+                    user=user,
+                    position=position,
                     election=previous_election,
                     is_active=True
                 ).first()
                 
                 if previous_candidate:
                     raise ValidationError(
-                        f"You cannot run for the same position '{self.position.name}' "
+                        f"You cannot run for the same position '{position.name}' "
                         f"in consecutive elections. You previously ran in {previous_election.title}."
                     )
     
@@ -88,25 +87,67 @@ class CandidateApplication(models.Model):
         if self.status == 'approved':
             return None  # Already approved
         
+        previous_review = (self.status, self.reviewed_by_id, self.reviewed_at)
         self.status = 'approved'
         self.reviewed_by = reviewer
         self.reviewed_at = timezone.now()
-        self.save()
+        try:
+            with transaction.atomic():
+                self.save(update_fields=['status', 'reviewed_by', 'reviewed_at'])
+        except IntegrityError:
+            # Nothing was saved, so don't leave the instance looking approved
+            self.status, self.reviewed_by_id, self.reviewed_at = previous_review
+            party_conflict = self.party_conflict_error()
+            if party_conflict is None:
+                raise
+            raise party_conflict
         
-        # Create Candidate instance
-        candidate, created = Candidate.objects.get_or_create(
-            user=self.user,
+        # Create Candidate instance; unique_together on (user, election, position)
+        # guards against duplicates, so only fall back to a lookup on conflict
+        try:
+            with transaction.atomic():
+                candidate = Candidate.objects.create(
+                    user=self.user,
+                    position=self.position,
+                    election=self.election,
+                    party=self.party,
+                    manifesto=self.manifesto,
+                    photo=self.photo,
+                    approved_application=self
+                )
+        except IntegrityError:
+            candidate = Candidate.objects.get(
+                user=self.user,
+                position=self.position,
+                election=self.election
+            )
+        
+        return candidate
+    
+    def party_conflict_error(self):
+        """Rule 2 error naming the party's already approved application, or None if there is none"""
+        existing_party_application = CandidateApplication.objects.filter(
             position=self.position,
             election=self.election,
-            defaults={
-                'party': self.party,
-                'manifesto': self.manifesto,
-                'photo': self.photo,
-                'approved_application': self
-            }
+            party=self.party,
+            status='approved'
+        ).exclude(pk=self.pk).select_related('user').first()
+        if not existing_party_application:
+            return None
+        return ValidationError(
+            f"Party '{self.party.name}' already has an approved candidate "
+            f"({existing_party_application.user.get_full_name()}) for {self.position.name}."
         )
-        
-        return candidate
+    
+    def validate_constraints(self, exclude=None):
+        """Report a Rule 2 violation (e.g. approving in the admin) with the same message as approve()"""
+        try:
+            super().validate_constraints(exclude=exclude)
+        except ValidationError:
+            party_conflict = self.party_conflict_error() if self.status == 'approved' and self.party_id else None
+            if party_conflict is None:
+                raise
+            raise party_conflict
     
     def reject(self, reviewer, notes=''):
         """Reject the application"""
@@ -114,14 +155,28 @@ class CandidateApplication(models.Model):
         self.reviewed_by = reviewer
         self.reviewed_at = timezone.now()
         self.review_notes = notes
-        self.save()
+        self.save(update_fields=['status', 'reviewed_by', 'reviewed_at', 'review_notes'])
     
     class Meta:
         db_table = 'candidates_candidateapplication'
         unique_together = [['user', 'election']]
+        constraints = [
+            # Rule 2: one approved application per party per position per election
+            models.UniqueConstraint(
+                fields=['position', 'election', 'party'],
+                condition=Q(status='approved') & Q(party__isnull=False),
+                name='uniq_approved_party_per_position'
+            ),
+        ]
         ordering = ['-submitted_at']
         verbose_name = 'Candidate Application'
         verbose_name_plural = 'Candidate Applications'
+        indexes = [
+            # Per-election pending/approved listings
+            models.Index(fields=['election', 'status']),
+            # Pending queue, newest first
+            models.Index(fields=['status', '-submitted_at']),
+        ]
 
 
 class Candidate(models.Model):
@@ -166,5 +221,9 @@ class Candidate(models.Model):
         db_table = 'candidates_candidate'
         ordering = ['position__display_order', 'user__first_name']
         unique_together = ['user', 'election', 'position']
+        indexes = [
+            # Listing filters: election, then position, then active only
+            models.Index(fields=['election', 'position', 'is_active']),
+        ]
         verbose_name = 'Candidate'
         verbose_name_plural = 'Candidates'
@@ -1,7 +1,15 @@
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.settings import api_settings
+from rest_framework import ISO_8601
+from rest_framework.relations import PKOnlyObject
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Exists, OuterRef, Prefetch, Value
+from django.db.models.functions import Concat, Trim
 from .models import Candidate, CandidateApplication
 from apps.elections.serializers import (
     SchoolPositionSerializer, 
@@ -9,10 +17,177 @@ from apps.elections.serializers import (
     SchoolElectionListSerializer
 )
 
+# Resolved once at import; BACKEND_BASE_URL is only read from the environment
+_BACKEND_BASE = (getattr(settings, 'BACKEND_BASE_URL', None) or '').rstrip('/') or None
+
+
+class PhotoURLField(serializers.Field):
+    """Read-only field rendering the object's photo as a full URL"""
+    
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def get_attribute(self, instance):
+        # Empty photos become None so DRF skips to_representation
+        return instance.photo or None
+    
+    def to_representation(self, photo):
+        url = photo.url
+        
+        # Use BACKEND_BASE_URL if configured (for remote access)
+        if _BACKEND_BASE:
+            return f"{_BACKEND_BASE}/{url.lstrip('/')}"
+        
+        # Fallback to request.build_absolute_uri() if available
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(url)
+        
+        # Last resort: return relative URL
+        return url
+
+
+class NativeDateTimeField(serializers.DateTimeField):
+    """
+    DateTimeField that leaves ISO 8601 formatting to the renderer.
+
+    Values are still converted to the current timezone, but are returned as
+    datetime objects for ORJSONRenderer to format natively.
+    """
+    
+    def to_representation(self, value):
+        if not value:
+            return None
+        
+        output_format = getattr(self, 'format', api_settings.DATETIME_FORMAT)
+        if output_format is None or isinstance(value, str) or output_format.lower() != ISO_8601:
+            return super().to_representation(value)
+        
+        return self.enforce_timezone(value)
+
+
+class NativeDateTimeMixin:
+    """Map model DateTimeFields to NativeDateTimeField"""
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DateTimeField: NativeDateTimeField,
+    }
+
+
+class EagerLoadingMixin:
+    """Let a serializer declare the relations it renders so views can load them up front"""
+    _SELECT_RELATED = ()
+    _PREFETCH_RELATED = ()
+    _DEFER = ()
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Apply select_related/prefetch_related for the nested fields this serializer renders"""
+        # The serializer's declaration replaces any select_related on the base queryset
+        # (a relation that is already joined would never be prefetched)
+        queryset = queryset.select_related(None)
+        if cls._SELECT_RELATED:
+            queryset = queryset.select_related(*cls._SELECT_RELATED)
+        if cls._PREFETCH_RELATED:
+            # Entries may be factories so Prefetch querysets are built per call
+            queryset = queryset.prefetch_related(*(
+                lookup() if callable(lookup) else lookup for lookup in cls._PREFETCH_RELATED
+            ))
+        # Skip columns the serializer never renders
+        if cls._DEFER:
+            queryset = queryset.defer(*cls._DEFER)
+        return queryset
+
+
+class BatchedNestedListSerializer(serializers.ListSerializer):
+    """List serializer that renders each distinct nested object once per response"""
+    
+    def to_representation(self, data):
+        self.child._nested_memo = {name: {} for name in self.child._BATCHED_FIELDS}
+        # Elections preloaded by the view (see ElectionsMapMixin) need no per-row access
+        if 'election' in self.child._nested_memo:
+            self.child._nested_memo['election'].update(self.context.get('elections_map', {}))
+        try:
+            return super().to_representation(data)
+        finally:
+            self.child._nested_memo = None
+
+
+class BatchedNestedMixin:
+    """
+    Reuse the rendered output of nested FK serializers listed in _BATCHED_FIELDS
+    across rows, and copy the fields listed in _RAW_FIELDS straight from the
+    instance (their DRF conversion is an identity for the stored values; primary key
+    fields render their FK id). Only active when serialized through
+    BatchedNestedListSerializer.
+    """
+    _BATCHED_FIELDS = ()
+    _RAW_FIELDS = ()
+    _nested_memo = None
+    
+    @cached_property
+    def _readable_field_plan(self):
+        # DRF re-walks self.fields through a generator on every row; the child
+        # serializer is shared by all rows of a list, so resolve it once
+        plan = []
+        for field in self._readable_fields:
+            if field.field_name in self._RAW_FIELDS:
+                attname = f'{field.source}_id' if isinstance(field, serializers.PrimaryKeyRelatedField) else field.source
+                plan.append((field, attname))
+            else:
+                plan.append((field, None))
+        return plan
+    
+    def to_representation(self, instance):
+        memo = self._nested_memo
+        if not memo:
+            return super().to_representation(instance)
+        
+        ret = {}
+        for field, raw_attname in self._readable_field_plan:
+            if raw_attname is not None:
+                ret[field.field_name] = getattr(instance, raw_attname)
+                continue
+            
+            field_memo = memo.get(field.field_name)
+            if field_memo is None:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+                continue
+            
+            related_pk = getattr(instance, f'{field.source}_id')
+            if related_pk is None:
+                ret[field.field_name] = None
+            elif related_pk in field_memo:
+                ret[field.field_name] = field_memo[related_pk]
+            else:
+                ret[field.field_name] = field_memo[related_pk] = field.to_representation(getattr(instance, field.source))
+        return ret
+
+
+# Relations rendered by CandidateUserSerializer and SchoolElectionListSerializer
+_USER_RELATED = ('user', 'user__profile', 'user__profile__course')
+def _user_prefetch():
+    """Load list users in one query, with their profile/course and a DB-computed full name"""
+    return Prefetch('user', queryset=User.objects.select_related(
+        'profile', 'profile__course'
+    ).defer(
+        'password', 'last_login', 'date_joined'
+    ).annotate(
+        _full_name=Trim(Concat('first_name', Value(' '), 'last_name'))
+    ))
+_ELECTION_RELATED = ('election', 'election__allowed_department', 'election__created_by')
+
 
 class CandidateUserSerializer(serializers.ModelSerializer):
     """Lightweight user serializer for candidate display"""
-    full_name = serializers.CharField(source='get_full_name', read_only=True)
+    full_name = serializers.SerializerMethodField()
     course_code = serializers.SerializerMethodField()
     year_level = serializers.SerializerMethodField()
     
@@ -21,6 +196,11 @@ class CandidateUserSerializer(serializers.ModelSerializer):
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'course_code', 'year_level']
         read_only_fields = fields
     
+    def get_full_name(self, obj):
+        """Use the full name computed in the query when available"""
+        full_name = getattr(obj, '_full_name', None)
+        return obj.get_full_name() if full_name is None else full_name
+    
     def get_course_code(self, obj):
         """Get course code from user profile"""
         if hasattr(obj, 'profile') and obj.profile and obj.profile.course:
@@ -34,13 +214,18 @@ class CandidateUserSerializer(serializers.ModelSerializer):
         return None
 
 
-class CandidateListSerializer(serializers.ModelSerializer):
+class CandidateListSerializer(BatchedNestedMixin, EagerLoadingMixin, NativeDateTimeMixin, serializers.ModelSerializer):
     """Serializer for candidate listings"""
+    _SELECT_RELATED = ('position', 'party')
+    _PREFETCH_RELATED = (_user_prefetch,)
+    _BATCHED_FIELDS = ('user', 'position', 'party', 'election')
+    _RAW_FIELDS = ('id', 'manifesto', 'is_active')
+    
     user = CandidateUserSerializer(read_only=True)
     position = SchoolPositionSerializer(read_only=True)
     party = PartySerializer(read_only=True)
     election = SchoolElectionListSerializer(read_only=True)
-    photo_url = serializers.SerializerMethodField()
+    photo_url = PhotoURLField()
     
     class Meta:
         model = Candidate
@@ -50,35 +235,19 @@ class CandidateListSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_photo_url(self, obj):
-        """Return full URL for candidate photo"""
-        if obj.photo:
-            request = self.context.get('request')
-            
-            # Use BACKEND_BASE_URL if configured (for remote access)
-            if hasattr(settings, 'BACKEND_BASE_URL') and settings.BACKEND_BASE_URL:
-                base_url = settings.BACKEND_BASE_URL.rstrip('/')
-                media_url = obj.photo.url.lstrip('/')
-                return f"{base_url}/{media_url}"
-            
-            # Fallback to request.build_absolute_uri() if available
-            if request:
-                return request.build_absolute_uri(obj.photo.url)
-            
-            # Last resort: return relative URL
-            return obj.photo.url
-        return None
+        list_serializer_class = BatchedNestedListSerializer
 
 
-class CandidateDetailSerializer(serializers.ModelSerializer):
+class CandidateDetailSerializer(EagerLoadingMixin, NativeDateTimeMixin, serializers.ModelSerializer):
     """Detailed serializer for candidate view"""
+    _SELECT_RELATED = _USER_RELATED + _ELECTION_RELATED + ('position', 'party')
+    
     user = CandidateUserSerializer(read_only=True)
     position = SchoolPositionSerializer(read_only=True)
     party = PartySerializer(read_only=True)
     election = SchoolElectionListSerializer(read_only=True)
-    application_id = serializers.IntegerField(source='approved_application.id', read_only=True, allow_null=True)
-    photo_url = serializers.SerializerMethodField()
+    application_id = serializers.IntegerField(source='approved_application_id', read_only=True, allow_null=True)
+    photo_url = PhotoURLField()
     
     class Meta:
         model = Candidate
@@ -89,29 +258,16 @@ class CandidateDetailSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at', 'approved_application']
-    
-    def get_photo_url(self, obj):
-        """Return full URL for candidate photo"""
-        if obj.photo:
-            request = self.context.get('request')
-            
-            # Use BACKEND_BASE_URL if configured (for remote access)
-            if hasattr(settings, 'BACKEND_BASE_URL') and settings.BACKEND_BASE_URL:
-                base_url = settings.BACKEND_BASE_URL.rstrip('/')
-                media_url = obj.photo.url.lstrip('/')
-                return f"{base_url}/{media_url}"
-            
-            # Fallback to request.build_absolute_uri() if available
-            if request:
-                return request.build_absolute_uri(obj.photo.url)
-            
-            # Last resort: return relative URL
-            return obj.photo.url
-        return None
 
 
-class CandidateApplicationListSerializer(serializers.ModelSerializer):
+class CandidateApplicationListSerializer(BatchedNestedMixin, EagerLoadingMixin, NativeDateTimeMixin, serializers.ModelSerializer):
     """Serializer for application listings"""
+    _SELECT_RELATED = ('position', 'party')
+    _PREFETCH_RELATED = (_user_prefetch,)
+    _DEFER = ('manifesto', 'photo', 'supporting_documents', 'review_notes')
+    _BATCHED_FIELDS = ('user', 'election')
+    _RAW_FIELDS = ('id', 'position', 'party', 'status')
+    
     user = CandidateUserSerializer(read_only=True)
     position_name = serializers.CharField(source='position.name', read_only=True)
     party_name = serializers.CharField(source='party.name', read_only=True, allow_null=True)
@@ -126,10 +282,13 @@ class CandidateApplicationListSerializer(serializers.ModelSerializer):
             'status', 'status_display', 'submitted_at'
         ]
         read_only_fields = ['submitted_at']
+        list_serializer_class = BatchedNestedListSerializer
 
 
-class CandidateApplicationDetailSerializer(serializers.ModelSerializer):
+class CandidateApplicationDetailSerializer(EagerLoadingMixin, NativeDateTimeMixin, serializers.ModelSerializer):
     """Detailed serializer for application view"""
+    _SELECT_RELATED = _USER_RELATED + _ELECTION_RELATED + ('position', 'party', 'reviewed_by')
+    
     user = CandidateUserSerializer(read_only=True)
     position = SchoolPositionSerializer(read_only=True)
     party = PartySerializer(read_only=True)
@@ -137,7 +296,7 @@ class CandidateApplicationDetailSerializer(serializers.ModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     reviewed_by_name = serializers.CharField(source='reviewed_by.get_full_name', read_only=True, allow_null=True)
     has_candidate = serializers.SerializerMethodField()
-    photo_url = serializers.SerializerMethodField()
+    photo_url = PhotoURLField()
     
     class Meta:
         model = CandidateApplication
@@ -153,28 +312,25 @@ class CandidateApplicationDetailSerializer(serializers.ModelSerializer):
             'reviewed_by_name', 'has_candidate'
         ]
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Also annotate candidate existence so has_candidate needs no per-row query"""
+        queryset = super().setup_eager_loading(queryset)
+        return queryset.annotate(
+            _has_candidate=Exists(Candidate.objects.filter(approved_application=OuterRef('pk')))
+        )
+    
     def get_has_candidate(self, obj):
         """Check if application has been converted to candidate"""
-        return hasattr(obj, 'candidate') and obj.candidate is not None
-    
-    def get_photo_url(self, obj):
-        """Return full URL for application photo"""
-        if obj.photo:
-            request = self.context.get('request')
-            
-            # Use BACKEND_BASE_URL if configured (for remote access)
-            if hasattr(settings, 'BACKEND_BASE_URL') and settings.BACKEND_BASE_URL:
-                base_url = settings.BACKEND_BASE_URL.rstrip('/')
-                media_url = obj.photo.url.lstrip('/')
-                return f"{base_url}/{media_url}"
-            
-            # Fallback to request.build_absolute_uri() if available
-            if request:
-                return request.build_absolute_uri(obj.photo.url)
-            
-            # Last resort: return relative URL
-            return obj.photo.url
-        return None
+        has_candidate = getattr(obj, '_has_candidate', None)
+        if has_candidate is not None:
+            return has_candidate
+        # Read a cached reverse relation directly; otherwise ask the DB instead of
+        # letting the descriptor raise RelatedObjectDoesNotExist
+        fields_cache = obj._state.fields_cache
+        if 'candidate' in fields_cache:
+            return fields_cache['candidate'] is not None
+        return Candidate.objects.filter(approved_application=obj).exists()
 
 
 class CandidateApplicationCreateSerializer(serializers.ModelSerializer):
@@ -210,7 +366,7 @@ class CandidateApplicationCreateSerializer(serializers.ModelSerializer):
         
         # Check eligibility to apply (skip for staff/admin)
         if election and not (user.is_staff or user.is_superuser):
-            if not election.is_user_eligible_to_apply(user):
+            if not self._is_user_eligible_to_apply(user, election):
                 if election.election_type == 'department':
                     dept_name = election.allowed_department.name if election.allowed_department else 'selected department'
                     raise serializers.ValidationError({
@@ -223,28 +379,43 @@ class CandidateApplicationCreateSerializer(serializers.ModelSerializer):
         
         # Check if user already has an active application for this election
         if election:
-            existing_application = CandidateApplication.objects.filter(
+            existing_applications = CandidateApplication.objects.filter(
                 user=user,
                 election=election,
                 status__in=['pending', 'approved']
-            ).first()
+            )
             
-            if existing_application:
+            if existing_applications.exists():
+                # Only load the row when we need it for the error message
+                existing_application = existing_applications.select_related('position').only(
+                    'status', 'position__name'
+                ).first()
                 raise serializers.ValidationError({
                     'election': f'You already have a {existing_application.get_status_display().lower()} application '
                                f'for {existing_application.position.name} in this election. '
                                f'Please withdraw your existing application first if you want to apply for a different position.'
                 })
         
-        # Create temporary instance for validation
-        temp_instance = CandidateApplication(user=user, **data)
+        # Remaining model rules. The active-application rule was checked above,
+        # and the rules run on the data directly instead of a temporary instance.
         try:
-            temp_instance.clean()
+            CandidateApplication.validate_consecutive_terms(user, election, data.get('position'))
         except ValidationError as e:
             raise serializers.ValidationError({'non_field_errors': e.messages})
         
         return data
     
+    def _is_user_eligible_to_apply(self, user, election):
+        """Memoize election eligibility on the request for repeated validation passes"""
+        request = self.context['request']
+        cache = getattr(request, '_eligibility_cache', None)
+        if cache is None:
+            cache = request._eligibility_cache = {}
+        key = (user.pk, election.pk)
+        if key not in cache:
+            cache[key] = election.is_user_eligible_to_apply(user)
+        return cache[key]
+    
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
@@ -256,12 +427,12 @@ class CandidateApplicationReviewSerializer(serializers.Serializer):
     review_notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     
     def validate(self, data):
+        # CharField already trims whitespace; treat null notes as blank
+        data['review_notes'] = data.get('review_notes') or ''
         # Require review_notes when rejecting (must be non-empty)
-        if data['action'] == 'reject':
-            review_notes = data.get('review_notes', '').strip() if data.get('review_notes') else ''
-            if not review_notes:
-                raise serializers.ValidationError({
-                    'review_notes': 'Review notes are required when rejecting an application.'
-                })
+        if data['action'] == 'reject' and not data['review_notes']:
+            raise serializers.ValidationError({
+                'review_notes': 'Review notes are required when rejecting an application.'
+            })
         return data
 
@@ -0,0 +1,59 @@
+"""
+Candidate Services
+Provides short-lived caching for candidate and application listings
+"""
+
+from django.core.cache import cache
+
+
+# Listings change rarely compared to how often they are read during an election
+LISTING_CACHE_TIMEOUT = 60
+
+
+class CandidateCacheService:
+    """
+    Cache listing responses per scope (e.g. 'by_election:3').
+
+    Each scope has a version number that is part of every key cached under it,
+    so invalidating a scope is a single version bump instead of deleting keys
+    by pattern (which the local-memory cache cannot do).
+
+    With the default local-memory cache every gunicorn worker has its own copy,
+    so a version bump only reaches the worker that made the change; the others
+    serve their cached listing until LISTING_CACHE_TIMEOUT expires. Only cache
+    listings that can be that stale (not the staff review queue).
+    """
+
+    @staticmethod
+    def _version_key(scope):
+        return f"candidates_cache_version:{scope}"
+
+    @classmethod
+    def get_or_set(cls, scope, key_parts, builder, timeout=LISTING_CACHE_TIMEOUT):
+        """
+        Return the cached value for scope/key_parts, building and caching it on a miss
+
+        Args:
+            scope: Invalidation scope the value belongs to
+            key_parts: Iterable of values that vary the response within the scope
+            builder: Callable producing the value on a cache miss
+            timeout: Cache timeout in seconds
+        """
+        version = cache.get_or_set(cls._version_key(scope), 1, timeout=None)
+        cache_key = f"candidates_cache:{scope}:v{version}:" + '|'.join(str(part) for part in key_parts)
+
+        result = cache.get(cache_key)
+        if result is None:
+            result = builder()
+            cache.set(cache_key, result, timeout=timeout)
+        return result
+
+    @classmethod
+    def invalidate(cls, scope):
+        """Invalidate everything cached under a scope"""
+        version_key = cls._version_key(scope)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            # No version yet, so nothing has been cached for this scope
+            pass
@@ -0,0 +1,19 @@
+"""
+Django signals for candidate events
+"""
+
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Candidate
+from .services import CandidateCacheService
+
+
+@receiver([post_save, post_delete], sender=Candidate)
+def invalidate_candidate_listings(sender, instance, **kwargs):
+    """Drop cached by_election listings for the candidate's election once the change is committed"""
+    # Invalidating before commit would let a concurrent request re-cache the old rows
+    transaction.on_commit(
+        partial(CandidateCacheService.invalidate, f"by_election:{instance.election_id}")
+    )
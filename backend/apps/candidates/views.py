@@ -1,12 +1,20 @@
+from functools import partial
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import QuerySet
 from apps.common.models import ActivityLog
+from apps.common.pagination import OptionalLimitOffsetPagination
 from apps.common.permissions import IsSuperUser, IsStaffOrSuperUser
 from apps.common.throttling import enforce_scope_throttle
+from apps.common.utils import get_client_ip, bulk_log_activity
+from apps.elections.models import SchoolElection
+from apps.elections.serializers import SchoolElectionListSerializer
 from .models import Candidate, CandidateApplication
+from .services import CandidateCacheService
 from .serializers import (
     CandidateListSerializer, CandidateDetailSerializer,
     CandidateApplicationListSerializer, CandidateApplicationDetailSerializer,
@@ -25,7 +33,97 @@ def health_check(request):
     })
 
 
-class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
+def _student_id(user):
+    """Return the user's student ID from their (joined) profile, or None"""
+    try:
+        return user.profile.student_id
+    except ObjectDoesNotExist:
+        return None
+
+
+def _build_review_log(application, reviewer, ip_address, outcome, candidate=None, review_notes=None, bulk=False):
+    """
+    Build (without saving) the ActivityLog entry for an application review.
+    
+    Args:
+        application: Reviewed CandidateApplication, with user__profile loaded
+        reviewer: Staff user who reviewed it
+        ip_address: Reviewer's IP address
+        outcome: 'approved' or 'rejected'
+        candidate: Candidate created by an approval (optional)
+        review_notes: Notes given with a rejection (optional)
+        bulk: Whether the review came from bulk_review
+    """
+    applicant = application.user
+    student_id = _student_id(applicant)
+    applicant_name = applicant.get_full_name()
+    position_name = application.position.name
+    election_title = application.election.title if application.election else 'Unknown Election'
+    
+    metadata = {'application_id': application.id}
+    if outcome == 'approved':
+        metadata['candidate_id'] = candidate.id if candidate else None
+    metadata.update({
+        'applicant_student_id': student_id,
+        'applicant_username': applicant.username,
+        'applicant_name': applicant_name,
+        'position': position_name,
+        'election': election_title,
+        'action': f"bulk_{outcome}" if bulk else outcome,
+    })
+    if outcome == 'rejected':
+        metadata['review_notes'] = review_notes
+    metadata['admin_username'] = reviewer.username
+    
+    return ActivityLog(
+        user=reviewer,
+        action='update',
+        resource_type='CandidateApplication',
+        resource_id=application.id,
+        description=(
+            f"Admin {reviewer.username} {'bulk ' if bulk else ''}{outcome} candidate application "
+            f"for {student_id or applicant.username} ({applicant_name}) - {position_name} in {election_title}"
+        ),
+        ip_address=ip_address,
+        metadata=metadata
+    )
+
+
+class ElectionsMapMixin:
+    """
+    Serialize the elections referenced by a list response once and hand them to
+    the list serializer as context['elections_map'], keyed by election id.
+    
+    Unpaginated querysets are serialized from a chunked iterator, so only
+    LIST_CHUNK_SIZE model instances (and their prefetched users) are held in
+    memory at a time.
+    """
+    LIST_CHUNK_SIZE = 500
+    
+    def get_serializer(self, *args, **kwargs):
+        if kwargs.get('many') and args:
+            instances = args[0]
+            context = kwargs.pop('context', None) or self.get_serializer_context()
+            if isinstance(instances, QuerySet):
+                # Select the elections with a subquery instead of loading the rows first
+                election_filter = {'id__in': instances.values('election_id')}
+                instances = instances.iterator(chunk_size=self.LIST_CHUNK_SIZE)
+            else:
+                instances = list(instances)
+                election_filter = {'id__in': {instance.election_id for instance in instances}}
+            elections = SchoolElection.objects.select_related(
+                'allowed_department', 'created_by'
+            ).filter(**election_filter)
+            context['elections_map'] = {
+                election['id']: election
+                for election in SchoolElectionListSerializer(elections, many=True, context=context).data
+            }
+            kwargs['context'] = context
+            args = (instances,) + args[1:]
+        return super().get_serializer(*args, **kwargs)
+
+
+class CandidateViewSet(ElectionsMapMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing candidates (read-only for public)"""
     queryset = Candidate.objects.select_related('user', 'position', 'election', 'party').all()
     permission_classes = [AllowAny]
@@ -38,6 +136,11 @@ class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        # Load the relations the active serializer renders
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            queryset = serializer_class.setup_eager_loading(queryset)
+        
         # Filter by election
         election_id = self.request.query_params.get('election', None)
         if election_id:
@@ -69,28 +172,45 @@ class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        candidates = self.get_queryset().filter(election_id=election_id)
-        serializer = self.get_serializer(candidates, many=True)
-        return Response(serializer.data)
+        def build():
+            candidates = self.get_queryset().filter(election_id=election_id)
+            return self.get_serializer(candidates, many=True).data
+        
+        if not election_id.isdigit():
+            return Response(build())
+        
+        # Cached per election; inactive candidates are only listed for staff, and
+        # photo URLs are absolute, so the scheme and host are part of the key
+        is_staff = request.user.is_staff or request.user.is_superuser
+        data = CandidateCacheService.get_or_set(
+            f"by_election:{int(election_id)}",
+            [is_staff, request.build_absolute_uri('/')],
+            build
+        )
+        return Response(data)
 
 
-class CandidateApplicationViewSet(viewsets.ModelViewSet):
+class CandidateApplicationViewSet(ElectionsMapMixin, viewsets.ModelViewSet):
     """ViewSet for managing candidate applications"""
     queryset = CandidateApplication.objects.select_related(
         'user', 'position', 'election', 'party', 'reviewed_by'
     ).all()
+    pagination_class = OptionalLimitOffsetPagination
+    # Most applications bulk_review accepts in one request
+    BULK_REVIEW_LIMIT = 500
+    # Permissions per action; every other action requires authentication.
+    # Staff can review applications, but only superusers can delete.
+    ACTION_PERMISSIONS = {
+        'update': (IsStaffOrSuperUser,),
+        'partial_update': (IsStaffOrSuperUser,),
+        'review': (IsStaffOrSuperUser,),
+        'bulk_review': (IsStaffOrSuperUser,),
+        'destroy': (IsSuperUser,),
+    }
     
     def get_permissions(self):
-        if self.action in ['create']:
-            return [IsAuthenticated()]
-        elif self.action in ['list', 'retrieve']:
-            return [IsAuthenticated()]
-        elif self.action in ['update', 'partial_update', 'destroy', 'review', 'bulk_review']:
-            # Staff can review applications, but only superusers can delete
-            if self.action == 'destroy':
-                return [IsSuperUser()]
-            return [IsStaffOrSuperUser()]
-        return [IsAuthenticated()]
+        permission_classes = self.ACTION_PERMISSIONS.get(self.action, (IsAuthenticated,))
+        return [permission() for permission in permission_classes]
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -105,6 +225,21 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
         user = self.request.user
         
+        if self.action == 'withdraw':
+            # Only ownership and status are checked
+            queryset = queryset.select_related(None).only('id', 'user_id', 'status')
+        elif self.action in ['review', 'bulk_review']:
+            # approve() copies the application into a Candidate, and the review
+            # log records the applicant's student ID, position and election
+            queryset = queryset.select_related(None).select_related(
+                'user__profile', 'position', 'election', 'party'
+            )
+        else:
+            # Load the relations the active serializer renders
+            serializer_class = self.get_serializer_class()
+            if hasattr(serializer_class, 'setup_eager_loading'):
+                queryset = serializer_class.setup_eager_loading(queryset)
+        
         # Non-staff users can only see their own applications
         if not user.is_staff:
             queryset = queryset.filter(user=user)
@@ -133,14 +268,29 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def my_applications(self, request):
         """Get current user's applications"""
-        applications = self.get_queryset().filter(user=request.user)
-        serializer = CandidateApplicationListSerializer(applications, many=True)
+        # Always scoped to the requesting user, so skip get_queryset()'s
+        # per-role filtering and only apply the serializer's eager loading
+        applications = self.get_serializer_class().setup_eager_loading(
+            super().get_queryset().filter(user=request.user)
+        )
+        
+        page = self.paginate_queryset(applications)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = self.get_serializer(applications, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[IsStaffOrSuperUser])
     def pending(self, request):
         """Get all pending applications (staff/admin only)"""
+        # Not cached: reviewers need the queue as it is right now
         pending_apps = self.get_queryset().filter(status='pending')
+        page = self.paginate_queryset(pending_apps)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
         serializer = self.get_serializer(pending_apps, many=True)
         return Response(serializer.data)
     
@@ -152,44 +302,18 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         
         action_type = serializer.validated_data['action']
-        review_notes = serializer.validated_data.get('review_notes', '')
+        review_notes = serializer.validated_data['review_notes']
         
-        # Get client IP
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(',')[0]
-        else:
-            ip_address = request.META.get('REMOTE_ADDR')
+        ip_address = get_client_ip(request)
         
         try:
             if action_type == 'approve':
                 candidate = application.approve(request.user)
                 
-                # Get student ID from application user's profile
-                applicant_profile = getattr(application.user, 'userprofile', None)
-                student_id = getattr(applicant_profile, 'student_id', None) if applicant_profile else None
-                applicant_identifier = student_id if student_id else application.user.username
-                
                 # Log the approval
-                ActivityLog.objects.create(
-                    user=request.user,
-                    action='update',
-                    resource_type='CandidateApplication',
-                    resource_id=application.id,
-                    description=f"Admin {request.user.username} approved candidate application for {applicant_identifier} ({application.user.get_full_name()}) - {application.position.name} in {application.election.title if application.election else 'Unknown Election'}",
-                    ip_address=ip_address,
-                    metadata={
-                        'application_id': application.id,
-                        'candidate_id': candidate.id if candidate else None,
-                        'applicant_student_id': student_id,
-                        'applicant_username': application.user.username,
-                        'applicant_name': application.user.get_full_name(),
-                        'position': application.position.name,
-                        'election': application.election.title if application.election else 'Unknown Election',
-                        'action': 'approved',
-                        'admin_username': request.user.username
-                    }
-                )
+                _build_review_log(
+                    application, request.user, ip_address, 'approved', candidate=candidate
+                ).save()
                 
                 return Response({
                     'message': 'Application approved successfully',
@@ -198,33 +322,12 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
                 }, status=status.HTTP_200_OK)
             
             elif action_type == 'reject':
-                # Get student ID before rejection
-                applicant_profile = getattr(application.user, 'userprofile', None)
-                student_id = getattr(applicant_profile, 'student_id', None) if applicant_profile else None
-                applicant_identifier = student_id if student_id else application.user.username
-                
                 application.reject(request.user, review_notes)
                 
                 # Log the rejection
-                ActivityLog.objects.create(
-                    user=request.user,
-                    action='update',
-                    resource_type='CandidateApplication',
-                    resource_id=application.id,
-                    description=f"Admin {request.user.username} rejected candidate application for {applicant_identifier} ({application.user.get_full_name()}) - {application.position.name} in {application.election.title if application.election else 'Unknown Election'}",
-                    ip_address=ip_address,
-                    metadata={
-                        'application_id': application.id,
-                        'applicant_student_id': student_id,
-                        'applicant_username': application.user.username,
-                        'applicant_name': application.user.get_full_name(),
-                        'position': application.position.name,
-                        'election': application.election.title if application.election else 'Unknown Election',
-                        'action': 'rejected',
-                        'review_notes': review_notes,
-                        'admin_username': request.user.username
-                    }
-                )
+                _build_review_log(
+                    application, request.user, ip_address, 'rejected', review_notes=review_notes
+                ).save()
                 
                 return Response({
                     'message': 'Application rejected',
@@ -256,89 +359,74 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get client IP
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(',')[0]
-        else:
-            ip_address = request.META.get('REMOTE_ADDR')
+        # Bound the id__in list before it reaches the database
+        if not isinstance(application_ids, list) or len(application_ids) > self.BULK_REVIEW_LIMIT:
+            return Response(
+                {'detail': f'application_ids must be a list of at most {self.BULK_REVIEW_LIMIT} ids; '
+                           f'split larger reviews into batches'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            application_ids = {int(application_id) for application_id in application_ids}
+        except (TypeError, ValueError):
+            return Response(
+                {'detail': 'application_ids must contain integer ids'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        ip_address = get_client_ip(request)
         
-        applications = self.get_queryset().filter(id__in=application_ids, status='pending')
         results = {'success': [], 'failed': []}
+        log_entries = []
         
-        for application in applications:
-            try:
-                if action_type == 'approve':
-                    candidate = application.approve(request.user)
-                    
-                    # Get student ID
-                    applicant_profile = getattr(application.user, 'userprofile', None)
-                    student_id = getattr(applicant_profile, 'student_id', None) if applicant_profile else None
-                    applicant_identifier = student_id if student_id else application.user.username
-                    
-                    # Log each approval
-                    ActivityLog.objects.create(
-                        user=request.user,
-                        action='update',
-                        resource_type='CandidateApplication',
-                        resource_id=application.id,
-                        description=f"Admin {request.user.username} bulk approved candidate application for {applicant_identifier} ({application.user.get_full_name()}) - {application.position.name} in {application.election.title if application.election else 'Unknown Election'}",
-                        ip_address=ip_address,
-                        metadata={
+        # Review everything in one transaction. Rows another reviewer has locked
+        # are skipped rather than waited on.
+        with transaction.atomic():
+            applications = list(
+                self.get_queryset().select_for_update(
+                    skip_locked=True, of=('self',)
+                ).filter(id__in=application_ids, status='pending')
+            )
+            
+            for application in applications:
+                try:
+                    if action_type == 'approve':
+                        # approve() runs its writes in savepoints, so a rejected
+                        # approval leaves the rest of the batch intact
+                        candidate = application.approve(request.user)
+                        log_entries.append(_build_review_log(
+                            application, request.user, ip_address, 'approved', candidate=candidate, bulk=True
+                        ))
+                        results['success'].append({
                             'application_id': application.id,
-                            'candidate_id': candidate.id if candidate else None,
-                            'applicant_student_id': student_id,
-                            'applicant_username': application.user.username,
-                            'applicant_name': application.user.get_full_name(),
-                            'position': application.position.name,
-                            'election': application.election.title if application.election else 'Unknown Election',
-                            'action': 'bulk_approved',
-                            'admin_username': request.user.username
-                        }
-                    )
+                            'candidate_id': candidate.id if candidate else None
+                        })
                     
-                    results['success'].append({
+                    elif action_type == 'reject':
+                        application.reject(request.user, review_notes)
+                        log_entries.append(_build_review_log(
+                            application, request.user, ip_address, 'rejected', review_notes=review_notes, bulk=True
+                        ))
+                        results['success'].append({'application_id': application.id})
+                
+                except DjangoValidationError as e:
+                    results['failed'].append({
                         'application_id': application.id,
-                        'candidate_id': candidate.id if candidate else None
+                        'error': str(e)
                     })
-                    
-                elif action_type == 'reject':
-                    # Get student ID before rejection
-                    applicant_profile = getattr(application.user, 'userprofile', None)
-                    student_id = getattr(applicant_profile, 'student_id', None) if applicant_profile else None
-                    applicant_identifier = student_id if student_id else application.user.username
-                    
-                    application.reject(request.user, review_notes)
-                    
-                    # Log each rejection
-                    ActivityLog.objects.create(
-                        user=request.user,
-                        action='update',
-                        resource_type='CandidateApplication',
-                        resource_id=application.id,
-                        description=f"Admin {request.user.username} bulk rejected candidate application for {applicant_identifier} ({application.user.get_full_name()}) - {application.position.name} in {application.election.title if application.election else 'Unknown Election'}",
-                        ip_address=ip_address,
-                        metadata={
-                            'application_id': application.id,
-                            'applicant_student_id': student_id,
-                            'applicant_username': application.user.username,
-                            'applicant_name': application.user.get_full_name(),
-                            'position': application.position.name,
-                            'election': application.election.title if application.election else 'Unknown Election',
-                            'action': 'bulk_rejected',
-                            'review_notes': review_notes,
-                            'admin_username': request.user.username
-                        }
-                    )
-                    
-                    results['success'].append({'application_id': application.id})
             
-            except DjangoValidationError as e:
+            # Ids that were not locked above were never reviewed; report them
+            reviewed_ids = {application.id for application in applications}
+            for application_id in sorted(application_ids - reviewed_ids):
                 results['failed'].append({
-                    'application_id': application.id,
-                    'error': str(e)
+                    'application_id': application_id,
+                    'error': 'Not reviewed: locked by another reviewer, not pending, or not found.'
                 })
-        
+            
+            # Write all review logs in one INSERT once the reviews are committed,
+            # so the row locks are not held while logging
+            transaction.on_commit(partial(bulk_log_activity, log_entries))
+
         return Response(results, status=status.HTTP_200_OK)
     
     @action(detail=True, methods=['post'])
@@ -347,7 +435,7 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
         application = self.get_object()
         
         # Check ownership
-        if application.user != request.user and not request.user.is_staff:
+        if application.user_id != request.user.id and not request.user.is_staff:
             return Response(
                 {'detail': 'You can only withdraw your own applications'},
                 status=status.HTTP_403_FORBIDDEN
@@ -360,7 +448,7 @@ class CandidateApplicationViewSet(viewsets.ModelViewSet):
             )
         
         application.status = 'withdrawn'
-        application.save()
+        application.save(update_fields=['status'])
         
         return Response({
             'message': 'Application withdrawn successfully',
@@ -1,98 +1,187 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from django.db import OperationalError, ProgrammingError
+from django.db import connections, router
 from django.core.exceptions import ImproperlyConfigured
+from django.contrib.admin.views.main import ChangeList
+from django.db.models.functions import Length, Substr
 from .models import SecurityEvent, ActivityLog, SystemSettings
+from .pagination import FasterAdminPaginator
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+BADGE_TEMPLATE = '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 3px;">{}</span>'
+DEFAULT_BADGE_COLOR = '#000000'
+SEVERITY_BADGE_COLORS = {
+    'low': '#28A745',
+    'medium': '#FFA500',
+    'high': '#FF6347',
+    'critical': '#DC3545',
+}
+# Choice labels looked up directly per row instead of through get_FOO_display()
+EVENT_TYPE_LABELS = dict(SecurityEvent.EVENT_TYPE_CHOICES)
+ACTION_LABELS = dict(ActivityLog.ACTION_CHOICES)
+
+
+# Tables already confirmed to exist; a table never disappears while the process runs
+_EXISTING_TABLES = set()
+
+
+def table_exists(model):
+    """Check whether a model's table has been created, querying the schema only until it has"""
+    table = model._meta.db_table
+    if table not in _EXISTING_TABLES:
+        connection = connections[router.db_for_read(model)]
+        if table not in connection.introspection.table_names():
+            return False
+        _EXISTING_TABLES.add(table)
+    return True
+
+
+@lru_cache(maxsize=16)
+def _fallback_badge(value):
+    """Badge for a value missing from the choices (e.g. a since-removed choice)"""
+    return format_html(BADGE_TEMPLATE, DEFAULT_BADGE_COLOR, value)
+
+
+class BadgeAdminMixin:
+    """
+    Render a colored badge column for a choice field.
+    
+    Subclasses set badge_choices and badge_colors; since the choices are fixed,
+    every badge is rendered once when the class is created.
+    """
+    
+    badge_choices = ()
+    badge_colors = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._badges = {
+            value: format_html(BADGE_TEMPLATE, cls.badge_colors.get(value, DEFAULT_BADGE_COLOR), label)
+            for value, label in cls.badge_choices
+        }
+    
+    def render_badge(self, value):
+        """Return the badge for a choice value"""
+        badge = self._badges.get(value)
+        if badge is None:
+            badge = _fallback_badge(value)
+        return badge
+
+
+DESCRIPTION_PREVIEW_LENGTH = 100
+
+
+class DescriptionPreviewChangeList(ChangeList):
+    """Changelist that loads only the listed columns and the start of the description"""
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.list_only_fields).annotate(
+            description_preview=Substr('description', 1, DESCRIPTION_PREVIEW_LENGTH),
+            description_length=Length('description'),
+        )
+
+
+class DescriptionPreviewMixin:
+    """Show a truncated description column computed by the database"""
+    
+    # Columns the changelist renders (including those used by __str__)
+    list_only_fields = ()
+    
+    def get_changelist(self, request, **kwargs):
+        return DescriptionPreviewChangeList
+    
+    def description_short(self, obj):
+        """Display shortened description"""
+        if obj.description_length > DESCRIPTION_PREVIEW_LENGTH:
+            return obj.description_preview + '...'
+        return obj.description_preview
+    description_short.short_description = 'Description'
+
 
 @admin.register(SecurityEvent)
-class SecurityEventAdmin(admin.ModelAdmin):
-    list_display = ['user', 'event_type', 'severity_badge', 'description_short', 'ip_address', 'created_at']
+class SecurityEventAdmin(BadgeAdminMixin, DescriptionPreviewMixin, admin.ModelAdmin):
+    list_display = ['user', 'event_type_label', 'severity_badge', 'description_short', 'ip_address', 'created_at']
+    # The (event_type, -created_at) and (severity, -created_at) indexes on the model
+    # serve these filters combined with the ordering below
     list_filter = ['event_type', 'severity', 'created_at']
-    search_fields = ['user__username', 'description', 'ip_address']
+    # description is a large unindexed TEXT column, so it is left out of search
+    search_fields = ['user__username', 'ip_address']
     ordering = ['-created_at']
     readonly_fields = ['created_at']
+    # Join the user shown on every row instead of fetching it per row
+    list_select_related = ['user']
+    # Skip the extra unfiltered COUNT(*) on this ever-growing table
+    show_full_result_count = False
+    paginator = FasterAdminPaginator
+    # Navigate by date range (uses the created_at index) rather than deep page offsets
+    date_hierarchy = 'created_at'
+    list_per_page = 50
+    list_only_fields = ['user__username', 'event_type', 'severity', 'ip_address', 'created_at']
+    badge_choices = SecurityEvent.SEVERITY_CHOICES
+    badge_colors = SEVERITY_BADGE_COLORS
     
     def get_queryset(self, request):
         """Override to handle missing table gracefully"""
-        try:
-            return super().get_queryset(request)
-        except (OperationalError, ProgrammingError) as e:
-            # Table doesn't exist or database error
-            logger.warning(f"SecurityEvent table not accessible: {e}")
-            # Return empty queryset
-            return SecurityEvent.objects.none()
-        except Exception as e:
-            logger.error(f"Unexpected error accessing SecurityEvent: {e}")
+        if not table_exists(SecurityEvent):
+            logger.warning("SecurityEvent table not accessible")
             return SecurityEvent.objects.none()
+        return super().get_queryset(request)
     
     def severity_badge(self, obj):
         """Display severity with color badge"""
-        try:
-            colors = {
-                'low': '#28A745',
-                'medium': '#FFA500',
-                'high': '#FF6347',
-                'critical': '#DC3545',
-            }
-            color = colors.get(obj.severity, '#000000')
-            return format_html(
-                '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 3px;">{}</span>',
-                color,
-                obj.get_severity_display()
-            )
-        except Exception as e:
-            logger.error(f"Error displaying severity badge: {e}")
-            return obj.get_severity_display() if hasattr(obj, 'get_severity_display') else str(obj.severity)
+        return self.render_badge(obj.severity)
     severity_badge.short_description = 'Severity'
     
-    def description_short(self, obj):
-        """Display shortened description"""
-        try:
-            return obj.description[:100] + '...' if len(obj.description) > 100 else obj.description
-        except Exception as e:
-            logger.error(f"Error displaying description: {e}")
-            return str(obj.description) if hasattr(obj, 'description') else ''
-    description_short.short_description = 'Description'
+    def event_type_label(self, obj):
+        """Display the event type label"""
+        return EVENT_TYPE_LABELS.get(obj.event_type, obj.event_type)
+    event_type_label.short_description = 'Event type'
+    event_type_label.admin_order_field = 'event_type'
 
 
 @admin.register(ActivityLog)
-class ActivityLogAdmin(admin.ModelAdmin):
-    list_display = ['user', 'action', 'resource_type', 'resource_id', 'description_short', 'created_at']
+class ActivityLogAdmin(DescriptionPreviewMixin, admin.ModelAdmin):
+    list_display = ['user', 'action_label', 'resource_type', 'resource_id', 'description_short', 'created_at']
+    # The (action, -created_at) and (resource_type, -created_at) indexes on the model
+    # serve these filters combined with the ordering below
     list_filter = ['action', 'resource_type', 'created_at']
-    search_fields = ['user__username', 'description', 'resource_type']
+    # description is a large unindexed TEXT column, so it is left out of search
+    search_fields = ['user__username', 'resource_type']
     ordering = ['-created_at']
     readonly_fields = ['created_at']
+    # Join the user shown on every row instead of fetching it per row
+    list_select_related = ['user']
+    # Skip the extra unfiltered COUNT(*) on this ever-growing table
+    show_full_result_count = False
+    paginator = FasterAdminPaginator
+    # Navigate by date range (uses the created_at index) rather than deep page offsets
+    date_hierarchy = 'created_at'
+    list_per_page = 50
+    list_only_fields = ['user__username', 'action', 'resource_type', 'resource_id', 'created_at']
     
     def get_queryset(self, request):
         """Override to handle missing table gracefully"""
-        try:
-            return super().get_queryset(request)
-        except (OperationalError, ProgrammingError) as e:
-            # Table doesn't exist or database error
-            logger.warning(f"ActivityLog table not accessible: {e}")
-            # Return empty queryset
-            return ActivityLog.objects.none()
-        except Exception as e:
-            logger.error(f"Unexpected error accessing ActivityLog: {e}")
+        if not table_exists(ActivityLog):
+            logger.warning("ActivityLog table not accessible")
             return ActivityLog.objects.none()
+        return super().get_queryset(request)
     
-    def description_short(self, obj):
-        """Display shortened description"""
-        try:
-            return obj.description[:100] + '...' if len(obj.description) > 100 else obj.description
-        except Exception as e:
-            logger.error(f"Error displaying description: {e}")
-            return str(obj.description) if hasattr(obj, 'description') else ''
-    description_short.short_description = 'Description'
+    def action_label(self, obj):
+        """Display the action label"""
+        return ACTION_LABELS.get(obj.action, obj.action)
+    action_label.short_description = 'Action'
+    action_label.admin_order_field = 'action'
 
 
 @admin.register(SystemSettings)
 class SystemSettingsAdmin(admin.ModelAdmin):
     list_display = ['key', 'value', 'updated_at', 'updated_by']
+    # Join the updating user shown on every row instead of fetching it per row
+    list_select_related = ['updated_by']
     search_fields = ['key', 'value', 'description']
     readonly_fields = ['updated_at', 'updated_by']
     
@@ -33,12 +33,72 @@ Usage Examples:
     sorted_items = sort_by(items, lambda x: x.score)
 """
 
-from collections import defaultdict
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable, Union, Tuple, Iterable
 from functools import lru_cache
+from itertools import chain, groupby, islice
+from operator import attrgetter, methodcaller
 import hashlib
 
 
+def _peek(items: Iterable[Any]) -> Tuple[Any, Iterable[Any]]:
+    """
+    Return the first item and an iterable that still yields every item
+    
+    The first item is None when items is empty.
+    """
+    iterator = iter(items)
+    for first in iterator:
+        return first, chain((first,), iterator)
+    return None, ()
+
+
+@lru_cache(maxsize=256)
+def _field_extractor(field: str, is_dict: bool, default: Any = None) -> Callable[[Any], Any]:
+    """
+    Getter for a dict key or attribute name that falls back to a default
+    
+    Specialized by input type once per call site, so rows are not type-checked.
+    """
+    if is_dict:
+        return methodcaller('get', field, default)
+    return lambda x: getattr(x, field, default)
+
+
+@lru_cache(maxsize=256)
+def _nested_field_extractor(field: str, subfield: str, is_dict: bool, default: Any = None) -> Callable[[Any], Any]:
+    """Like _field_extractor, for one level of nesting (e.g. department -> name)"""
+    if is_dict:
+        return lambda x: x.get(field, {}).get(subfield, default)
+    return lambda x: getattr(getattr(x, field, None), subfield, default)
+
+
+def _field_getter(field: str, sample: Any) -> Callable[[Any], Any]:
+    """
+    Build a getter for a field name based on a sample item
+    
+    Missing fields give 'N/A', the same default the lambda keys use
+    (e.g. getattr(item, key, 'N/A')), so sparse records are grouped rather
+    than raising. Attribute names may be dotted paths such as 'department.name'.
+    """
+    is_dict = isinstance(sample, dict)
+    if is_dict or '.' not in field:
+        return _field_extractor(field, is_dict, 'N/A')
+    
+    getter = attrgetter(field)
+    
+    def get_path(item):
+        try:
+            return getter(item)
+        except AttributeError:
+            return 'N/A'
+    return get_path
+
+
 class DataGroupingAlgorithm:
     """
     General-purpose multi-level grouping algorithm using hash maps
@@ -48,7 +108,7 @@ class DataGroupingAlgorithm:
     @staticmethod
     def group_by(
         items: Iterable[Any],
-        key_func: Callable[[Any], Any],
+        key_func: Union[str, Callable[[Any], Any]],
         value_func: Optional[Callable[[Any], Any]] = None
     ) -> Dict[Any, List[Any]]:
         """
@@ -56,7 +116,8 @@ class DataGroupingAlgorithm:
         
         Args:
             items: Iterable of items to group (any type)
-            key_func: Function to extract grouping key from item
+            key_func: Function to extract grouping key from item, or a dict key /
+                attribute name ('N/A' when the field is missing)
             value_func: Optional function to transform item before adding to group
         
         Returns:
@@ -74,22 +135,80 @@ class DataGroupingAlgorithm:
                 key_func=lambda s: s.year_level,
                 value_func=lambda s: s.student_id
             )
+            
+            # Group by field name
+            grouped = group_by(students, 'year_level')
         """
-        result = defaultdict(list)
-        for item in items:
+        if isinstance(key_func, str):
+            sample, items = _peek(items)
+            key_func = _field_getter(key_func, sample)
+        
+        # A missed lookup only happens once per key, so handle it as the exception
+        result = {}
+        if value_func:
+            for item in items:
+                key = key_func(item)
+                try:
+                    result[key].append(value_func(item))
+                except KeyError:
+                    result[key] = [value_func(item)]
+        else:
+            for item in items:
+                key = key_func(item)
+                try:
+                    result[key].append(item)
+                except KeyError:
+                    result[key] = [item]
+        return result
+    
+    @staticmethod
+    def group_indices(
+        items: Iterable[Any],
+        key_func: Union[str, Callable[[Any], Any]]
+    ) -> Dict[Any, 'array']:
+        """
+        Group item positions by key without keeping the items themselves
+        
+        Useful for large or streamed inputs (e.g. queryset iterators) where only
+        group sizes or positions are needed afterwards.
+        
+        Args:
+            items: Iterable of items to group (any type)
+            key_func: Function to extract grouping key from item, or a dict key /
+                attribute name ('N/A' when the field is missing)
+        
+        Returns:
+            Dictionary: {key: array('i') of item positions in input order}
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n) machine ints instead of O(n) object references
+        
+        Example:
+            positions = group_indices(students.iterator(), 'year_level')
+            sizes = {year: len(indices) for year, indices in positions.items()}
+        """
+        if isinstance(key_func, str):
+            sample, items = _peek(items)
+            key_func = _field_getter(key_func, sample)
+        
+        result = {}
+        for index, item in enumerate(items):
             key = key_func(item)
-            value = value_func(item) if value_func else item
-            result[key].append(value)
-        return dict(result)
+            try:
+                result[key].append(index)
+            except KeyError:
+                result[key] = array('i', (index,))
+        return result
     
     @staticmethod
     def group_by_hierarchy(
         items: Iterable[Any],
         hierarchy_keys: List[Union[str, Callable]],
-        extract_key: Callable[[Any, Union[str, Callable]], Any],
+        extract_key: Optional[Callable[[Any, Union[str, Callable]], Any]] = None,
         extract_data: Optional[Callable[[Any], Any]] = None,
         include_metadata: bool = True,
-        default_key: Any = 'N/A'
+        default_key: Any = 'N/A',
+        extract_keys: Optional[Callable[[Any], Sequence[Any]]] = None
     ) -> Dict:
         """
         Group items by multiple hierarchy levels efficiently using hash maps
@@ -101,9 +220,13 @@ class DataGroupingAlgorithm:
                 - String: for dict keys or object attributes
                 - Callable: function to extract key from item
             extract_key: Function to extract key value (item, key) -> value
+                (superseded by extract_keys)
             extract_data: Optional function to transform item before storing
             include_metadata: Whether to include metadata in result
             default_key: Default value for missing keys
+            extract_keys: Function returning all hierarchy values for an item in
+                one call, item -> (level1, level2, ...), optionally followed by
+                the first level's code for the metadata
         
         Returns:
             Nested dictionary structure: {level1: {level2: {level3: {...}}}}
@@ -125,50 +248,73 @@ class DataGroupingAlgorithm:
                 ['department', 'course'],
                 lambda item, key: getattr(item, key, None).name if hasattr(getattr(item, key, None), 'name') else 'N/A'
             )
+            
+            # All levels (and the department code) in one call per item
+            group_by_hierarchy(
+                students,
+                ['department', 'course'],
+                extract_keys=lambda s: (s.department.name, s.course.name, s.department.code)
+            )
         """
-        result = {}
+        if not hierarchy_keys:
+            return {}
+        if extract_key is None and extract_keys is None:
+            raise ValueError("group_by_hierarchy requires extract_key or extract_keys")
+        
+        depth = len(hierarchy_keys)
+        last_level = depth - 1
+        # Only intermediate first-level nodes carry a 'code'
+        annotate_code = include_metadata and last_level > 0
+        code_key = None
+        if annotate_code:
+            first_key = hierarchy_keys[0]
+            if isinstance(first_key, str) and 'name' in first_key:
+                code_key = first_key.replace('name', 'code')
+            elif isinstance(first_key, str):
+                code_key = f"{first_key}_code"
+        
+        if extract_keys is None:
+            def extract_keys(item):
+                return [extract_key(item, key) for key in hierarchy_keys]
+            
+            def extract_code(item, values):
+                return (extract_key(item, code_key) or default_key) if code_key else default_key
+        else:
+            def extract_code(item, values):
+                return (values[depth] if len(values) > depth else None) or default_key
         
+        # Group on the full key path first, then build the nested levels once per group
+        groups = {}
+        codes = {}
         for item in items:
-            current_level = result
-            metadata = {}
+            values = extract_keys(item)
+            path = tuple([value or default_key for value in values[:depth]])
             
-            # Navigate/create hierarchy levels
-            for i, key in enumerate(hierarchy_keys):
-                key_value = extract_key(item, key) or default_key
-                
-                # Extract metadata if needed
-                if include_metadata and i == 0:
-                    if isinstance(key, str) and 'name' in key:
-                        metadata_key = key.replace('name', 'code')
-                    elif isinstance(key, str):
-                        metadata_key = f"{key}_code"
-                    else:
-                        metadata_key = None
-                    
-                    if metadata_key:
-                        metadata['code'] = extract_key(item, metadata_key) or default_key
-                
-                # Create level if doesn't exist
-                if key_value not in current_level:
-                    if i == len(hierarchy_keys) - 1:
-                        # Last level - create data structure
-                        current_level[key_value] = {
-                            'count': 0,
-                            'items': []
-                        }
-                    else:
-                        # Intermediate level
-                        current_level[key_value] = {}
-                        if include_metadata and i == 0:
-                            current_level[key_value]['code'] = metadata.get('code', default_key)
-                
-                current_level = current_level[key_value]
+            if annotate_code and path[0] not in codes:
+                codes[path[0]] = extract_code(item, values)
             
-            # Add item to final level
-            if 'items' in current_level:
-                item_data = extract_data(item) if extract_data else item
-                current_level['items'].append(item_data)
-                current_level['count'] += 1
+            item_data = extract_data(item) if extract_data else item
+            group = groups.get(path)
+            if group is None:
+                groups[path] = [item_data]
+            else:
+                group.append(item_data)
+        
+        result = {}
+        for path, group_items in groups.items():
+            current_level = result
+            for i in range(last_level):
+                key_value = path[i]
+                node = current_level.get(key_value)
+                if node is None:
+                    node = current_level[key_value] = {}
+                    if annotate_code and i == 0:
+                        node['code'] = codes[key_value]
+                current_level = node
+            current_level[path[last_level]] = {
+                'count': len(group_items),
+                'items': group_items
+            }
         
         return result
     
@@ -199,29 +345,38 @@ class DataGroupingAlgorithm:
                 ]
             )
         """
-        result = {}
-        
+        # Group on the full key tuple first, then build the nested levels once per group
+        groups = {}
         for item in items:
-            current = result
-            keys = [func(item) for func in key_funcs]
-            
-            # Navigate/create nested structure
-            for i, key in enumerate(keys[:-1]):
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-            
-            # Add to final level
-            final_key = keys[-1]
-            if final_key not in current:
-                current[final_key] = []
-            
+            keys = tuple([func(item) for func in key_funcs])
             value = value_func(item) if value_func else item
-            current[final_key].append(value)
+            group = groups.get(keys)
+            if group is None:
+                groups[keys] = [value]
+            else:
+                group.append(value)
+        
+        result = {}
+        for keys, values in groups.items():
+            current = result
+            for key in keys[:-1]:
+                node = current.get(key)
+                if node is None:
+                    node = current[key] = {}
+                current = node
+            current[keys[-1]] = values
         
         return result
 
 
+@dataclass(slots=True)
+class _AggBucket:
+    """Running totals for one group while aggregating (converted to a dict in the result)"""
+    count: int = 0
+    sum: float = 0
+    values: List[float] = field(default_factory=list)
+
+
 class AggregationAlgorithm:
     """
     General-purpose aggregation algorithms for counting, summing, and statistical operations
@@ -262,48 +417,96 @@ class AggregationAlgorithm:
                 operation='sum'
             )
         """
-        result = defaultdict(lambda: {
-            'count': 0,
-            'sum': 0,
-            'values': [],
-            'items': []
-        })
+        if operation in ('sum', 'avg', 'min', 'max'):
+            return AggregationAlgorithm._aggregate_numeric(items, key_func, value_func, operation)
+        
+        if operation == 'count':
+            # Counter tallies the extracted keys in C
+            return dict(Counter(map(key_func, items)))
+        
+        if operation == 'list':
+            grouped = {}
+            for item in items:
+                category = key_func(item)
+                try:
+                    grouped[category].append(item)
+                except KeyError:
+                    grouped[category] = [item]
+            return grouped
+        
+        if operation == 'set':
+            # Deduplicate while grouping instead of keeping every item first
+            unique = defaultdict(set)
+            for item in items:
+                unique[key_func(item)].add(item)
+            return {category: list(category_items) for category, category_items in unique.items()}
+        
+        counts = defaultdict(int)
+        items_by_category = defaultdict(list)
         
         for item in items:
             category = key_func(item)
-            result[category]['count'] += 1
-            result[category]['items'].append(item)
-            
-            if value_func and operation in ['sum', 'avg', 'min', 'max']:
-                value = value_func(item)
-                try:
-                    value = float(value)
-                    result[category]['sum'] += value
-                    result[category]['values'].append(value)
-                except (ValueError, TypeError):
-                    pass
+            counts[category] += 1
+            items_by_category[category].append(item)
         
         # Apply operation
         final_result = {}
-        for category, data in result.items():
-            if operation == 'count':
-                final_result[category] = data['count']
-            elif operation == 'sum':
-                final_result[category] = data['sum']
-            elif operation == 'avg':
-                final_result[category] = data['sum'] / data['count'] if data['count'] > 0 else 0
-            elif operation == 'min':
-                final_result[category] = min(data['values']) if data['values'] else None
+        for category, category_items in items_by_category.items():
+            final_result[category] = {
+                'count': counts[category],
+                'sum': 0,
+                'values': [],
+                'items': category_items
+            }
+        
+        return final_result
+    
+    @staticmethod
+    def _aggregate_numeric(
+        items: Iterable[Any],
+        key_func: Callable[[Any], Any],
+        value_func: Optional[Callable[[Any], Any]],
+        operation: str
+    ) -> Dict[Any, Any]:
+        """
+        Single-pass sum/avg/min/max keeping one running value per category
+        
+        Values that cannot be converted to float are skipped, but the item still
+        counts towards the category (and the average's denominator).
+        """
+        counts = {}
+        running = {}
+        initial = None if operation in ('min', 'max') else 0
+        
+        for item in items:
+            category = key_func(item)
+            if category in counts:
+                counts[category] += 1
+            else:
+                counts[category] = 1
+                running[category] = initial
+            
+            if not value_func:
+                continue
+            value = value_func(item)
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                continue
+            
+            current = running[category]
+            if operation == 'min':
+                if current is None or value < current:
+                    running[category] = value
             elif operation == 'max':
-                final_result[category] = max(data['values']) if data['values'] else None
-            elif operation == 'list':
-                final_result[category] = data['items']
-            elif operation == 'set':
-                final_result[category] = list(set(data['items']))
+                if current is None or value > current:
+                    running[category] = value
             else:
-                final_result[category] = data
+                running[category] = current + value
         
-        return final_result
+        if operation == 'avg':
+            return {category: total / counts[category] for category, total in running.items()}
+        return running
     
     @staticmethod
     def aggregate_by_category(
@@ -316,7 +519,7 @@ class AggregationAlgorithm:
         Aggregate items by category (convenience method for dictionaries/objects)
         
         Args:
-            items: Iterable of items (dicts or objects)
+            items: Iterable of items (dicts or objects, one kind, not mixed)
             category_key: String key name or function to extract category
             value_key: Optional string key name or function to extract value
             operation: 'count', 'sum', 'avg', 'min', 'max', 'list', 'set'
@@ -342,14 +545,16 @@ class AggregationAlgorithm:
             )
         """
         # Convert string keys to functions
+        sample, items = _peek(items)
+        is_dict = isinstance(sample, dict)
         if isinstance(category_key, str):
-            key_func = lambda x: x.get(category_key, 'N/A') if isinstance(x, dict) else getattr(x, category_key, 'N/A')
+            key_func = _field_extractor(category_key, is_dict, 'N/A')
         else:
             key_func = category_key
         
         if value_key:
             if isinstance(value_key, str):
-                value_func = lambda x: x.get(value_key, 0) if isinstance(x, dict) else getattr(x, value_key, 0)
+                value_func = _field_extractor(value_key, is_dict, 0)
             else:
                 value_func = value_key
         else:
@@ -378,39 +583,48 @@ class AggregationAlgorithm:
         
         Time Complexity: O(n * m) where m=group levels
         """
-        result = {}
+        collect_values = operation in ['sum', 'avg']
         
+        # Aggregate per full group path first, then build the nested levels once per group
+        buckets = {}
         for item in items:
-            current = result
-            
-            # Navigate/create group structure
+            path = []
             for key in group_keys:
-                key_value = item.get(key, {}).get('name', 'N/A') if isinstance(item.get(key), dict) else item.get(key, 'N/A')
-                
-                if key_value not in current:
-                    current[key_value] = {}
-                
-                current = current[key_value]
+                key_value = item.get(key, 'N/A')
+                if isinstance(key_value, dict):
+                    key_value = key_value.get('name', 'N/A')
+                path.append(key_value)
+            path = tuple(path)
             
-            # Aggregate at final level
-            if aggregate_key not in current:
-                current[aggregate_key] = {
-                    'count': 0,
-                    'sum': 0,
-                    'values': []
-                }
+            bucket = buckets.get(path)
+            if bucket is None:
+                bucket = buckets[path] = _AggBucket()
             
-            current[aggregate_key]['count'] += 1
+            bucket.count += 1
             
-            if operation in ['sum', 'avg']:
+            if collect_values:
                 value = item.get(aggregate_key, 0)
                 try:
                     value = float(value)
-                    current[aggregate_key]['sum'] += value
-                    current[aggregate_key]['values'].append(value)
+                    bucket.sum += value
+                    bucket.values.append(value)
                 except (ValueError, TypeError):
                     pass
         
+        result = {}
+        for path, bucket in buckets.items():
+            current = result
+            for key_value in path:
+                node = current.get(key_value)
+                if node is None:
+                    node = current[key_value] = {}
+                current = node
+            current[aggregate_key] = {
+                'count': bucket.count,
+                'sum': bucket.sum,
+                'values': bucket.values
+            }
+        
         return result
 
 
@@ -455,29 +669,30 @@ class CategorizationAlgorithm:
                 }
             )
         """
-        result = {}
-        count_func = count_func or (lambda x: 1)
+        extractors = list(hierarchy_config.values())
         
-        for item in items:
+        def path(item):
+            return tuple([extract_func(item) or 'N/A' for extract_func in extractors])
+        
+        # Count on the full level path first, then build the nested levels once per group
+        if count_func is None:
+            # Counter tallies in C, which is the common case of counting items
+            totals = Counter(map(path, items))
+        else:
+            totals = {}
+            for item in items:
+                key = path(item)
+                totals[key] = totals.get(key, 0) + count_func(item)
+        
+        result = {}
+        for key, count in totals.items():
             current = result
-            levels = list(hierarchy_config.keys())
-            
-            for i, level_name in enumerate(levels):
-                extract_func = hierarchy_config[level_name]
-                level_value = extract_func(item) or 'N/A'
-                
-                if level_value not in current:
-                    if i == len(levels) - 1:
-                        # Last level - create count structure
-                        current[level_value] = {'count': 0}
-                    else:
-                        # Intermediate level
-                        current[level_value] = {}
-                
-                current = current[level_value]
-            
-            # Increment count at final level
-            current['count'] += count_func(item)
+            for level_value in key[:-1]:
+                node = current.get(level_value)
+                if node is None:
+                    node = current[level_value] = {}
+                current = node
+            current[key[-1]] = {'count': count}
         
         return result
     
@@ -493,7 +708,7 @@ class CategorizationAlgorithm:
         Categorize votes/profiles by demographics (backward compatibility + flexibility)
         
         Args:
-            voter_profiles: Iterable of voter profile objects/dicts
+            voter_profiles: Iterable of voter profile objects/dicts (one kind, not mixed)
             election_type: 'university' or 'department'
             dept_extractor: Optional function to extract department (default: dict access)
             course_extractor: Optional function to extract course (default: dict access)
@@ -502,13 +717,15 @@ class CategorizationAlgorithm:
         Returns:
             Categorized structure
         """
-        # Default extractors for dictionary access
+        # Default extractors for dictionary/object access
+        sample, voter_profiles = _peek(voter_profiles)
+        is_dict = isinstance(sample, dict)
         if dept_extractor is None:
-            dept_extractor = lambda p: p.get('department', {}).get('name', 'Unassigned Department') if isinstance(p, dict) else getattr(getattr(p, 'department', None), 'name', 'Unassigned Department')
+            dept_extractor = _nested_field_extractor('department', 'name', is_dict, 'Unassigned Department')
         if course_extractor is None:
-            course_extractor = lambda p: p.get('course', {}).get('name', 'Unassigned Course') if isinstance(p, dict) else getattr(getattr(p, 'course', None), 'name', 'Unassigned Course')
+            course_extractor = _nested_field_extractor('course', 'name', is_dict, 'Unassigned Course')
         if year_extractor is None:
-            year_extractor = lambda p: p.get('year_level', 'N/A') if isinstance(p, dict) else getattr(p, 'year_level', 'N/A')
+            year_extractor = _field_extractor('year_level', is_dict, 'N/A')
         
         if election_type == 'department':
             config = {
@@ -570,14 +787,15 @@ class OrganizationAlgorithm:
             )
         """
         organized = {}
-        levels = list(hierarchy_config.keys())
+        last_level = len(hierarchy_config) - 1
+        # (extractor, is last level) pairs, resolved once rather than per item and level
+        levels = [(extract_func, i == last_level) for i, extract_func in enumerate(hierarchy_config.values())]
         
         for item in items:
             current = organized
             
             # Navigate/create hierarchy
-            for i, level_name in enumerate(levels):
-                extract_func = hierarchy_config[level_name]
+            for extract_func, is_last_level in levels:
                 level_data = extract_func(item)
                 
                 # Handle tuple (name, code) or single value
@@ -591,7 +809,7 @@ class OrganizationAlgorithm:
                 
                 # Initialize level
                 if level_key not in current:
-                    if i == len(levels) - 1:
+                    if is_last_level:
                         # Last level
                         current[level_key] = {
                             'count': 0,
@@ -609,8 +827,7 @@ class OrganizationAlgorithm:
             
             # Add item to final level
             if include_items and current.get('items') is not None:
-                item_data = item_transform(item) if item_transform else item
-                current['items'].append(item_data)
+                current['items'].append(item_transform(item) if item_transform else item)
             current['count'] += 1
         
         return organized
@@ -624,54 +841,16 @@ class OrganizationAlgorithm:
         Organize students by academic hierarchy (backward compatibility)
         
         Args:
-            students: Iterable of student objects/dicts
+            students: Iterable of student objects or dicts (one kind, not mixed)
             include_student_list: Whether to include student objects in result
         
         Returns:
             Organized structure
         """
-        # Default extractors
-        def dept_extractor(s):
-            if isinstance(s, dict):
-                dept = s.get('department', {})
-                return (dept.get('name', 'Unassigned Department'), dept.get('code', 'N/A'))
-            else:
-                dept = getattr(s, 'department', None)
-                return (getattr(dept, 'name', 'Unassigned Department') if dept else 'Unassigned Department',
-                       getattr(dept, 'code', 'N/A') if dept else 'N/A')
-        
-        def course_extractor(s):
-            if isinstance(s, dict):
-                course = s.get('course', {})
-                return (course.get('name', 'Unassigned Course'), course.get('code', 'N/A'))
-            else:
-                course = getattr(s, 'course', None)
-                return (getattr(course, 'name', 'Unassigned Course') if course else 'Unassigned Course',
-                       getattr(course, 'code', 'N/A') if course else 'N/A')
-        
-        def year_extractor(s):
-            if isinstance(s, dict):
-                return s.get('year_level', 'N/A')
-            else:
-                return getattr(s, 'year_level', 'N/A')
-        
-        def student_transform(s):
-            if isinstance(s, dict):
-                user = s.get('user', {})
-                return {
-                    'student_id': s.get('student_id', 'N/A'),
-                    'name': f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or user.get('username', 'Unknown'),
-                    'year_level': s.get('year_level', 'N/A'),
-                    'user': {'id': user.get('id')}
-                }
-            else:
-                user = getattr(s, 'user', None)
-                return {
-                    'student_id': getattr(s, 'student_id', 'N/A'),
-                    'name': f"{getattr(user, 'first_name', '')} {getattr(user, 'last_name', '')}".strip() if user else getattr(user, 'username', 'Unknown'),
-                    'year_level': getattr(s, 'year_level', 'N/A'),
-                    'user': {'id': getattr(user, 'id', None) if user else None}
-                }
+        sample, students = _peek(students)
+        # Input is either all dicts or all objects, so pick the extractors once
+        extractors = _STUDENT_DICT_EXTRACTORS if isinstance(sample, dict) else _STUDENT_OBJECT_EXTRACTORS
+        dept_extractor, course_extractor, year_extractor, student_transform = extractors
         
         return OrganizationAlgorithm.organize_by_hierarchy(
             students,
@@ -685,6 +864,63 @@ class OrganizationAlgorithm:
         )
 
 
+def _dict_department(s):
+    dept = s.get('department', {})
+    return (dept.get('name', 'Unassigned Department'), dept.get('code', 'N/A'))
+
+
+def _dict_course(s):
+    course = s.get('course', {})
+    return (course.get('name', 'Unassigned Course'), course.get('code', 'N/A'))
+
+
+def _dict_year_level(s):
+    return s.get('year_level', 'N/A')
+
+
+def _dict_student(s):
+    user = s.get('user', {})
+    return {
+        'student_id': s.get('student_id', 'N/A'),
+        'name': f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or user.get('username', 'Unknown'),
+        'year_level': s.get('year_level', 'N/A'),
+        'user': {'id': user.get('id')}
+    }
+
+
+def _object_department(s):
+    dept = getattr(s, 'department', None)
+    if not dept:
+        return ('Unassigned Department', 'N/A')
+    return (getattr(dept, 'name', 'Unassigned Department'), getattr(dept, 'code', 'N/A'))
+
+
+def _object_course(s):
+    course = getattr(s, 'course', None)
+    if not course:
+        return ('Unassigned Course', 'N/A')
+    return (getattr(course, 'name', 'Unassigned Course'), getattr(course, 'code', 'N/A'))
+
+
+def _object_year_level(s):
+    return getattr(s, 'year_level', 'N/A')
+
+
+def _object_student(s):
+    user = getattr(s, 'user', None)
+    return {
+        'student_id': getattr(s, 'student_id', 'N/A'),
+        'name': f"{getattr(user, 'first_name', '')} {getattr(user, 'last_name', '')}".strip() if user else 'Unknown',
+        'year_level': getattr(s, 'year_level', 'N/A'),
+        'user': {'id': getattr(user, 'id', None) if user else None}
+    }
+
+
+# (department, course, year level, student) extractors per input type
+_STUDENT_DICT_EXTRACTORS = (_dict_department, _dict_course, _dict_year_level, _dict_student)
+_STUDENT_OBJECT_EXTRACTORS = (_object_department, _object_course, _object_year_level, _object_student)
+
+
 class BatchProcessingAlgorithm:
     """
     Algorithms for processing large datasets in batches
@@ -692,7 +928,7 @@ class BatchProcessingAlgorithm:
     
     @staticmethod
     def process_in_batches(
-        items: List[Any],
+        items: Iterable[Any],
         batch_size: int,
         processor: Callable[[List[Any]], Any],
         accumulator: Optional[Callable[[Any, Any], Any]] = None
@@ -701,7 +937,8 @@ class BatchProcessingAlgorithm:
         Process large datasets in batches to avoid memory issues
         
         Args:
-            items: List of items to process
+            items: Items to process; sequences are sliced, other iterables
+                (generators, iterators) are consumed one batch at a time
             batch_size: Number of items per batch
             processor: Function to process each batch
             accumulator: Optional function to accumulate batch results
@@ -714,8 +951,7 @@ class BatchProcessingAlgorithm:
         """
         results = []
         
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
+        for batch in BatchProcessingAlgorithm._batches(items, batch_size):
             batch_result = processor(batch)
             
             if accumulator:
@@ -727,6 +963,81 @@ class BatchProcessingAlgorithm:
                 results.append(batch_result)
         
         return results
+    
+    @staticmethod
+    def _batches(items: Iterable[Any], batch_size: int) -> Iterator[Any]:
+        """Yield consecutive batches without materializing non-sequence inputs first"""
+        if isinstance(items, Sequence):
+            for i in range(0, len(items), batch_size):
+                yield items[i:i + batch_size]
+            return
+        
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def _bisect_search(arr: List[Any], target_val: Any, key: Optional[Callable]) -> Optional[int]:
+    """
+    Binary search using the C bisect module
+    
+    The probe loop runs in C with no per-step None or TypeError handling.
+    Returns the index of the leftmost match or -1, or None when the values
+    cannot be ordered against each other.
+    """
+    try:
+        index = bisect_left(arr, target_val, key=key)
+    except TypeError:
+        return None
+    if index < len(arr) and (key(arr[index]) if key else arr[index]) == target_val:
+        return index
+    return -1
+
+
+def _tolerant_binary_search(arr: List[Any], target_val: Any, key: Optional[Callable]) -> int:
+    """
+    Step-by-step binary search for values that cannot all be ordered
+    
+    None sorts before everything else, and a comparison between incompatible
+    types ends the search as not found.
+    """
+    left, right = 0, len(arr) - 1
+    
+    while left <= right:
+        mid = (left + right) // 2
+        mid_item = arr[mid]
+        mid_val = key(mid_item) if key else mid_item
+        
+        # Handle None values - None is not comparable with other types
+        if mid_val is None or target_val is None:
+            if mid_val == target_val:  # Both None
+                return mid
+            # If one is None, skip comparison and continue
+            if mid_val is None:
+                left = mid + 1
+                continue
+            if target_val is None:
+                right = mid - 1
+                continue
+        
+        try:
+            if mid_val == target_val:
+                return mid
+            elif mid_val < target_val:
+                left = mid + 1
+            else:
+                right = mid - 1
+        except TypeError:
+            # Handle comparison errors (e.g., different types)
+            if mid_val == target_val:
+                return mid
+            # If types are incompatible, we can't compare - return not found
+            return -1
+    
+    return -1
 
 
 class SearchingAlgorithm:
@@ -754,41 +1065,13 @@ class SearchingAlgorithm:
         if not arr:
             return -1
         
-        left, right = 0, len(arr) - 1
-        
-        while left <= right:
-            mid = (left + right) // 2
-            mid_item = arr[mid]
-            mid_val = key(mid_item) if key else mid_item
-            target_val = key(target) if key else target
-            
-            # Handle None values - None is not comparable with other types
-            if mid_val is None or target_val is None:
-                if mid_val == target_val:  # Both None
-                    return mid
-                # If one is None, skip comparison and continue
-                if mid_val is None:
-                    left = mid + 1
-                    continue
-                if target_val is None:
-                    right = mid - 1
-                    continue
-            
-            try:
-                if mid_val == target_val:
-                    return mid
-                elif mid_val < target_val:
-                    left = mid + 1
-                else:
-                    right = mid - 1
-            except TypeError:
-                # Handle comparison errors (e.g., different types)
-                if mid_val == target_val:
-                    return mid
-                # If types are incompatible, we can't compare - return not found
-                return -1
-        
-        return -1
+        target_val = key(target) if key else target
+        # None never orders against other values, so only the tolerant search handles it
+        if target_val is not None:
+            index = _bisect_search(arr, target_val, key)
+            if index is not None:
+                return index
+        return _tolerant_binary_search(arr, target_val, key)
     
     @staticmethod
     def binary_search_by_field(
@@ -800,7 +1083,7 @@ class SearchingAlgorithm:
         Binary search in list of objects/dictionaries by field
         
         Args:
-            arr: Sorted list of objects or dictionaries
+            arr: Sorted list of objects or dictionaries (one kind, not mixed)
             target_value: Value to find (raw value, not an object)
             field: Field name (string) or accessor function
         
@@ -819,44 +1102,56 @@ class SearchingAlgorithm:
         
         # Create key function to extract field from array items
         if isinstance(field, str):
-            def key_func(x):
-                return x.get(field) if isinstance(x, dict) else getattr(x, field, None)
+            key_func = _field_extractor(field, isinstance(arr[0], dict))
         else:
             key_func = field
         
-        # Binary search - compare target_value with extracted field values
-        left, right = 0, len(arr) - 1
+        if target_value is not None:
+            index = _bisect_search(arr, target_value, key_func)
+            if index is not None:
+                return index
+        return _tolerant_binary_search(arr, target_value, key_func)
+    
+    @staticmethod
+    def binary_search_bulk(
+        arr: List[Any],
+        targets: Iterable[Any],
+        key: Optional[Callable] = None
+    ) -> List[int]:
+        """
+        Binary search for many targets in the same sorted list
+        
+        Keys are extracted from arr once up front, so each lookup is a plain
+        bisect over the key list with no key calls per probe.
         
-        while left <= right:
-            mid = (left + right) // 2
-            mid_item = arr[mid]
-            mid_val = key_func(mid_item)
-            
-            # Handle None values
-            if mid_val is None or target_value is None:
-                if mid_val == target_value:
-                    return mid
-                if mid_val is None:
-                    left = mid + 1
-                    continue
-                if target_value is None:
-                    right = mid - 1
-                    continue
-            
-            try:
-                if mid_val == target_value:
-                    return mid
-                elif mid_val < target_value:
-                    left = mid + 1
+        Args:
+            arr: Sorted list to search
+            targets: Raw values to find (not items)
+            key: Optional key function the list is sorted by
+        
+        Returns:
+            Index of each target (leftmost match), -1 where not found
+        
+        Time Complexity: O(n + t log n) for t targets
+        
+        Example:
+            indices = binary_search_bulk(sorted_students, student_ids, key=lambda s: s['student_id'])
+        """
+        keys = [key(item) for item in arr] if key else arr
+        size = len(keys)
+        
+        indices = []
+        for target_val in targets:
+            if target_val is not None:
+                try:
+                    index = bisect_left(keys, target_val)
+                except TypeError:
+                    pass
                 else:
-                    right = mid - 1
-            except TypeError:
-                # Handle comparison errors
-                if mid_val == target_value:
-                    return mid
-                return -1
-        
-        return -1
+                    indices.append(index if index < size and keys[index] == target_val else -1)
+                    continue
+            indices.append(_tolerant_binary_search(keys, target_val, None))
+        return indices
     
     @staticmethod
     def find_all(
@@ -882,22 +1177,60 @@ class SearchingAlgorithm:
 class CryptographicAlgorithm:
     
     @staticmethod
-    def sha256_hash(data: str) -> str:
+    def sha256_hash(data: Union[str, bytes]) -> str:
 
-        return hashlib.sha256(data.encode()).hexdigest()
+        if isinstance(data, str):
+            data = data.encode()
+        return hashlib.sha256(data).hexdigest()
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def cache_key_hash(key_string: str) -> str:
+        """
+        SHA-256 hex digest of a service cache key string, memoized
+        
+        The same key strings are hashed on every request, so repeats are served
+        from a bounded LRU; clear it with cache_key_hash.cache_clear(). Use
+        sha256_hash for one-off inputs such as receipts and vote hashes.
+        """
+        return CryptographicAlgorithm.sha256_hash(key_string)
+    
+    @staticmethod
+    def sha256_digest(data: Union[str, bytes]) -> bytes:
+        """
+        Raw SHA-256 digest for callers that only compare or store bytes
+        
+        Returns:
+            32-byte digest
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        return hashlib.sha256(data).digest()
+    
+    @staticmethod
+    def fast_cache_key(data: bytes) -> bytes:
+        """
+        Short BLAKE2b digest for in-process cache keys (not for stored hashes)
+        
+        Returns:
+            8-byte digest
+        """
+        return hashlib.blake2b(data, digest_size=8).digest()
 
 
 class MemoizationAlgorithm:
 
     @staticmethod
     def memoize_with_key(
-        key_generator: Callable[..., str]
+        key_generator: Optional[Callable[..., Any]] = None
     ) -> Callable:
         """
         Create a memoization decorator with custom key generation
         
         Args:
-            key_generator: Function to generate cache key from arguments
+            key_generator: Function to generate cache key from arguments.
+                Defaults to the arguments themselves; calls with unhashable
+                arguments fall back to generate_hash_key.
         
         Returns:
             Memoization decorator
@@ -906,12 +1239,22 @@ class MemoizationAlgorithm:
         
         def decorator(func):
             def wrapper(*args, **kwargs):
-                cache_key = key_generator(*args, **kwargs)
+                if key_generator is not None:
+                    cache_key = key_generator(*args, **kwargs)
+                else:
+                    cache_key = (args, tuple(sorted(kwargs.items())))
                 
-                if cache_key not in cache:
-                    cache[cache_key] = func(*args, **kwargs)
+                try:
+                    return cache[cache_key]
+                except KeyError:
+                    pass
+                except TypeError:
+                    cache_key = MemoizationAlgorithm.generate_hash_key(*args, **kwargs)
+                    if cache_key in cache:
+                        return cache[cache_key]
                 
-                return cache[cache_key]
+                result = cache[cache_key] = func(*args, **kwargs)
+                return result
             
             wrapper.cache_clear = lambda: cache.clear()
             return wrapper
@@ -919,7 +1262,7 @@ class MemoizationAlgorithm:
         return decorator
     
     @staticmethod
-    def generate_hash_key(*args, **kwargs) -> str:
+    def generate_hash_key(*args, **kwargs) -> bytes:
         """
         Generate a hash-based cache key from arguments
         
@@ -928,12 +1271,16 @@ class MemoizationAlgorithm:
             **kwargs: Keyword arguments
         
         Returns:
-            SHA-256 hash string (hex)
+            8-byte BLAKE2b digest
         """
         key_parts = [str(arg) for arg in args]
         key_parts.extend([f"{k}:{v}" for k, v in sorted(kwargs.items())])
         key_string = '|'.join(key_parts)
-        return CryptographicAlgorithm.sha256_hash(key_string)
+        return CryptographicAlgorithm.fast_cache_key(key_string.encode())
+
+
+# Key types sort_nested_dict orders by value; anything else sorts as ''
+_ORDERABLE = (str, int, float)
 
 
 class SortingAlgorithm:
@@ -944,65 +1291,33 @@ class SortingAlgorithm:
     @staticmethod
     def quicksort(arr: List[Any], key: Optional[Callable] = None, reverse: bool = False) -> List[Any]:
         """
-        Quicksort algorithm - O(n log n) average, O(n²) worst case
+        Sort a list - O(n log n), stable
         Efficient for sorting election results, candidates by vote count, etc.
         
+        Delegates to the built-in Timsort, which calls key once per element.
+        Equal elements keep their input order (also with reverse=True).
+        
         Args:
             arr: List to sort
             key: Optional key function (e.g., lambda x: x['vote_count'])
             reverse: Whether to sort in descending order
         
         Returns:
-            Sorted list (in-place modification)
+            Sorted list (new list, original unchanged)
         
         Example:
             candidates = quicksort(candidates, key=lambda c: c['vote_count'], reverse=True)
         """
-        if len(arr) <= 1:
-            return arr
-        
-        arr = arr.copy()  # Don't modify original
-        SortingAlgorithm._quicksort_helper(arr, 0, len(arr) - 1, key, reverse)
-        return arr
-    
-    @staticmethod
-    def _quicksort_helper(arr: List[Any], low: int, high: int, key: Optional[Callable], reverse: bool):
-        """Helper function for quicksort"""
-        if low < high:
-            pi = SortingAlgorithm._partition(arr, low, high, key, reverse)
-            SortingAlgorithm._quicksort_helper(arr, low, pi - 1, key, reverse)
-            SortingAlgorithm._quicksort_helper(arr, pi + 1, high, key, reverse)
-    
-    @staticmethod
-    def _partition(arr: List[Any], low: int, high: int, key: Optional[Callable], reverse: bool) -> int:
-        """Partition function for quicksort"""
-        pivot = arr[high]
-        pivot_val = key(pivot) if key else pivot
-        
-        i = low - 1
-        
-        for j in range(low, high):
-            current = arr[j]
-            current_val = key(current) if key else current
-            
-            if reverse:
-                compare = current_val >= pivot_val
-            else:
-                compare = current_val <= pivot_val
-            
-            if compare:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-        
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
+        return sorted(arr, key=key, reverse=reverse)
     
     @staticmethod
     def mergesort(arr: List[Any], key: Optional[Callable] = None, reverse: bool = False) -> List[Any]:
         """
-        Merge sort algorithm - O(n log n) guaranteed, stable sort
+        Merge sort - O(n log n) guaranteed, stable sort
         Useful when maintaining relative order of equal elements matters
         
+        Delegates to the built-in Timsort (an adaptive merge sort).
+        
         Args:
             arr: List to sort
             key: Optional key function for custom sorting
@@ -1014,40 +1329,7 @@ class SortingAlgorithm:
         Example:
             students = mergesort(students, key=lambda s: s['student_id'])
         """
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = SortingAlgorithm.mergesort(arr[:mid], key, reverse)
-        right = SortingAlgorithm.mergesort(arr[mid:], key, reverse)
-        
-        return SortingAlgorithm._merge(left, right, key, reverse)
-    
-    @staticmethod
-    def _merge(left: List[Any], right: List[Any], key: Optional[Callable], reverse: bool) -> List[Any]:
-        """Merge function for mergesort"""
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            left_val = key(left[i]) if key else left[i]
-            right_val = key(right[j]) if key else right[j]
-            
-            if reverse:
-                compare = left_val >= right_val
-            else:
-                compare = left_val <= right_val
-            
-            if compare:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+        return sorted(arr, key=key, reverse=reverse)
     
     @staticmethod
     def sort_nested_dict(
@@ -1069,45 +1351,57 @@ class SortingAlgorithm:
         if not sort_keys:
             return data
         
-        sorted_data = {}
-        current_key = sort_keys[0]
         remaining_keys = sort_keys[1:]
         
         # Sort current level
         sorted_items = sorted(
             data.items(),
-            key=lambda x: x[0] if isinstance(x[0], (str, int, float)) else '',
+            key=lambda x: x[0] if isinstance(x[0], _ORDERABLE) else '',
             reverse=reverse
         )
         
-        for key, value in sorted_items:
-            if isinstance(value, dict) and remaining_keys:
-                # Recursively sort nested levels
-                sorted_data[key] = SortingAlgorithm.sort_nested_dict(
-                    value,
-                    remaining_keys,
-                    reverse
-                )
-            else:
-                sorted_data[key] = value
-        
-        return sorted_data
+        # Recursively sort nested levels
+        return {
+            key: (
+                SortingAlgorithm.sort_nested_dict(value, remaining_keys, reverse)
+                if remaining_keys and isinstance(value, dict) else value
+            )
+            for key, value in sorted_items
+        }
 
-def group_by(items: Iterable[Any], key_func: Callable[[Any], Any]) -> Dict[Any, List[Any]]:
+def group_by(items: Iterable[Any], key_func: Union[str, Callable[[Any], Any]],
+             *, presorted: bool = False) -> Dict[Any, List[Any]]:
     """
     Convenience function for simple grouping
     
     Args:
         items: Iterable of items
-        key_func: Function to extract grouping key
+        key_func: Function to extract grouping key, or a dict key / attribute name
+        presorted: Items with equal keys are adjacent (e.g. ordered by the key),
+            so groups are collected run by run with itertools.groupby
     
     Returns:
         Dictionary: {key: [items]}
     
     Example:
         grouped = group_by(students, lambda s: s.department)
+        grouped = group_by(results.order_by('position'), 'position_id', presorted=True)
     """
-    return DataGroupingAlgorithm.group_by(items, key_func)
+    if not presorted:
+        return DataGroupingAlgorithm.group_by(items, key_func)
+    
+    if isinstance(key_func, str):
+        sample, items = _peek(items)
+        key_func = _field_getter(key_func, sample)
+    
+    result = {}
+    for key, run in groupby(items, key_func):
+        # A key that shows up in more than one run still collects every item
+        try:
+            result[key].extend(run)
+        except KeyError:
+            result[key] = list(run)
+    return result
 
 
 def aggregate_by(items: Iterable[Any], key_func: Callable[[Any], Any], 
@@ -1144,7 +1438,7 @@ def sort_by(items: List[Any], key_func: Optional[Callable[[Any], Any]] = None,
         items: List to sort
         key_func: Optional key function
         reverse: Whether to reverse sort
-        algorithm: 'quicksort' or 'mergesort'
+        algorithm: 'quicksort' or 'mergesort' (both use the built-in stable sort)
     
     Returns:
         Sorted list
@@ -1152,10 +1446,7 @@ def sort_by(items: List[Any], key_func: Optional[Callable[[Any], Any]] = None,
     Example:
         sorted_items = sort_by(students, key_func=lambda s: s.name)
     """
-    if algorithm == 'mergesort':
-        return SortingAlgorithm.mergesort(items, key_func, reverse)
-    else:
-        return SortingAlgorithm.quicksort(items, key_func, reverse)
+    return sorted(items, key=key_func, reverse=reverse)
 
 
 def search(items: List[Any], target: Any, key_func: Optional[Callable[[Any], Any]] = None,
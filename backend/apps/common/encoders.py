@@ -0,0 +1,19 @@
+"""
+Custom JSON encoders for E-Botar
+"""
+import json
+
+import orjson
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """
+    json.JSONEncoder that encodes with orjson.
+
+    Meant for JSONField(encoder=...): Django serializes field values with
+    json.dumps(value, cls=encoder), which calls encode(). Unsupported types
+    raise TypeError like the standard encoder.
+    """
+
+    def encode(self, o):
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode()
@@ -305,7 +305,7 @@ def test_memoization():
     
     assert key1 == key2, "Hash key should be deterministic for same inputs"
     assert key1 != key3, "Hash key should be different for different inputs"
-    assert len(key1) == 64, f"SHA-256 hash should be 64 chars, got {len(key1)}"
+    assert len(key1) == 8, f"BLAKE2b cache key should be 8 bytes, got {len(key1)}"
     print("✓ Hash key generation test passed")
     
     # Test memoization with multiple arguments
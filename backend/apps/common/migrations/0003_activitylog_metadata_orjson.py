@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-16 07:46
+
+import apps.common.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_systemsettings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='metadata',
+            field=models.JSONField(blank=True, default=dict, encoder=apps.common.encoders.ORJSONEncoder),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-16 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_activitylog_metadata_orjson'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['action', '-created_at'], name='common_acti_action_e166bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['resource_type', '-created_at'], name='common_acti_resourc_88be07_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['severity', '-created_at'], name='common_secu_severit_8b87db_idx'),
+        ),
+    ]
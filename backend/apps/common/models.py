@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from .encoders import ORJSONEncoder
 
 
 class SecurityEvent(models.Model):
@@ -40,6 +41,7 @@ class SecurityEvent(models.Model):
         verbose_name_plural = 'Security Events'
         indexes = [
             models.Index(fields=['event_type', '-created_at']),
+            models.Index(fields=['severity', '-created_at']),
             models.Index(fields=['user', '-created_at']),
         ]
     
@@ -69,7 +71,7 @@ class ActivityLog(models.Model):
     resource_id = models.IntegerField(null=True, blank=True, help_text="ID of the affected resource")
     description = models.TextField()
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    metadata = models.JSONField(default=dict, blank=True)
+    metadata = models.JSONField(default=dict, blank=True, encoder=ORJSONEncoder)
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
     
     class Meta:
@@ -80,6 +82,8 @@ class ActivityLog(models.Model):
         indexes = [
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['resource_type', 'resource_id']),
+            models.Index(fields=['action', '-created_at']),
+            models.Index(fields=['resource_type', '-created_at']),
         ]
     
     def __str__(self):
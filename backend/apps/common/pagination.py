@@ -0,0 +1,57 @@
+"""
+Custom pagination classes for E-Botar
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination that only applies when the client passes ?limit=.
+
+    Without it the endpoint keeps returning a plain list, so existing clients
+    are unaffected while large listings can be fetched page by page.
+    """
+
+    default_limit = None
+    max_limit = 100
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Admin paginator that estimates the row count of large unfiltered tables.
+
+    On PostgreSQL an exact COUNT(*) scans the whole table, so for unfiltered
+    changelists the planner's estimate from pg_class is used instead. Filtered
+    querysets, small tables and other database backends get the exact count.
+    """
+
+    # Below this many rows the exact count is cheap and preferable
+    ESTIMATE_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None and estimate > self.ESTIMATE_THRESHOLD:
+            return estimate
+        return super().count
+
+    def _estimated_count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return None
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that have never been analyzed
+        return row[0] if row else None
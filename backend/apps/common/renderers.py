@@ -0,0 +1,37 @@
+"""
+Custom renderers for E-Botar
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Types orjson does not handle natively (Decimal, lazy strings, querysets,
+    ...) fall back to DRF's JSONEncoder so the output matches JSONRenderer.
+    Datetimes are formatted by orjson the same way DateTimeField does
+    (full ISO 8601, UTC as 'Z').
+    U+2028/U+2029 are escaped like JSONRenderer does, so responses stay
+    valid JavaScript.
+    Unlike JSONRenderer (STRICT_JSON), NaN and Infinity floats render as
+    null instead of raising ValueError.
+    Indented output (browsable API / ?indent) is left to JSONRenderer.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        # orjson leaves the line/paragraph separators unescaped (both start with e2 80)
+        if b'\xe2\x80' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -0,0 +1,19 @@
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer output compared with DRF's JSONRenderer"""
+
+    def test_line_separators_escaped_like_json_renderer(self):
+        data = {'description': 'line\u2028break\u2029end', 'name': 'Ñoño ✓'}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_non_finite_floats_render_as_null(self):
+        # JSONRenderer raises ValueError here (STRICT_JSON); orjson writes null
+        data = {'nan': float('nan'), 'inf': float('inf'), 'ninf': float('-inf')}
+        self.assertEqual(ORJSONRenderer().render(data), b'{"nan":null,"inf":null,"ninf":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
@@ -36,6 +36,23 @@ def log_activity(user, action, resource_type, resource_id=None, description='',
         logger.error(f"Failed to log activity: {e}")
 
 
+def bulk_log_activity(entries):
+    """
+    Save several unsaved ActivityLog instances in one INSERT
+    
+    Args:
+        entries: List of unsaved ActivityLog instances
+    """
+    try:
+        from django.db import OperationalError, ProgrammingError
+        ActivityLog.objects.bulk_create(entries, batch_size=500)
+    except (OperationalError, ProgrammingError) as e:
+        # Table doesn't exist - silently skip logging
+        logger.debug(f"ActivityLog table not available, skipping logs: {e}")
+    except Exception as e:
+        logger.error(f"Failed to log activities: {e}")
+
+
 def log_security_event(user, event_type, severity, description, ip_address=None, user_agent='', metadata=None):
     """
     Log security event
@@ -68,11 +85,22 @@ def log_security_event(user, event_type, severity, description, ip_address=None,
 
 
 def get_client_ip(request):
-    """Extract client IP address from request"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    """
+    Extract client IP address from request
+    
+    The result is cached on the underlying HttpRequest, so DRF views,
+    admin actions and middleware handling the same request parse it once.
+    """
+    http_request = getattr(request, '_request', request)
+    ip = getattr(http_request, '_client_ip', None)
+    if ip is not None:
+        return ip
+    
+    x_forwarded_for = http_request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
+        ip = x_forwarded_for.split(',', 1)[0].strip()
     else:
-        ip = request.META.get('REMOTE_ADDR')
+        ip = http_request.META.get('REMOTE_ADDR')
+    http_request._client_ip = ip
     return ip
 
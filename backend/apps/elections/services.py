@@ -39,7 +39,7 @@ def cache_result(timeout):
             
             # Generate hash for cache key using SHA-256
             key_string = '|'.join(key_parts)
-            cache_key = f"election_service_{CryptographicAlgorithm.sha256_hash(key_string)}"
+            cache_key = f"election_service_{CryptographicAlgorithm.cache_key_hash(key_string)}"
             
             # Try to get from cache
             result = cache.get(cache_key)
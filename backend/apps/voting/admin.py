@@ -1,7 +1,18 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from .models import VoteReceipt, AnonVote, Ballot, VoteChoice
 
+# Fixed badges, rendered once at import time
+CHECK_MARK = format_html('<span style="color: {};">{}</span>', '#28A745', '✓')
+CROSS_MARK = format_html('<span style="color: {};">{}</span>', '#DC3545', '✗')
+ANONYMIZED_BADGE = mark_safe(
+    '<span style="background-color: #28A745; color: white; padding: 3px 10px; border-radius: 3px;">Anonymized</span>'
+)
+PENDING_BADGE = mark_safe(
+    '<span style="background-color: #FFA500; color: white; padding: 3px 10px; border-radius: 3px;">Pending</span>'
+)
+
 
 @admin.register(VoteReceipt)
 class VoteReceiptAdmin(admin.ModelAdmin):
@@ -55,11 +66,7 @@ class BallotAdmin(admin.ModelAdmin):
     
     def has_receipt(self, obj):
         """Display if ballot has receipt"""
-        return format_html(
-            '<span style="color: {};">{}</span>',
-            '#28A745' if obj.receipt else '#DC3545',
-            '✓' if obj.receipt else '✗'
-        )
+        return CHECK_MARK if obj.receipt else CROSS_MARK
     has_receipt.short_description = 'Receipt'
     
     def total_choices(self, obj):
@@ -87,13 +94,7 @@ class VoteChoiceAdmin(admin.ModelAdmin):
     
     def anonymized_badge(self, obj):
         """Display anonymization status with badge"""
-        if obj.anonymized:
-            return format_html(
-                '<span style="background-color: #28A745; color: white; padding: 3px 10px; border-radius: 3px;">Anonymized</span>'
-            )
-        return format_html(
-            '<span style="background-color: #FFA500; color: white; padding: 3px 10px; border-radius: 3px;">Pending</span>'
-        )
+        return ANONYMIZED_BADGE if obj.anonymized else PENDING_BADGE
     anonymized_badge.short_description = 'Status'
     
     actions = ['anonymize_choices']
@@ -40,7 +40,7 @@ def cache_result(timeout):
             
             # Generate hash for cache key using SHA-256
             key_string = '|'.join(key_parts)
-            cache_key = f"voting_service_{CryptographicAlgorithm.sha256_hash(key_string)}"
+            cache_key = f"voting_service_{CryptographicAlgorithm.cache_key_hash(key_string)}"
             
             # Try to get from cache
             result = cache.get(cache_key)
@@ -383,14 +383,12 @@ class VotingDataService:
         # Clear specific user voting status cache
         key_parts = ['get_user_voting_status', str(user_id), str(election_id)]
         key_string = '|'.join(key_parts)
-        cache_key = f"voting_service_{CryptographicAlgorithm.sha256_hash(key_string)}"
+        cache_key = f"voting_service_{CryptographicAlgorithm.cache_key_hash(key_string)}"
         cache.delete(cache_key)
     
     # Memoized computation functions for expensive calculations
     @staticmethod
-    @MemoizationAlgorithm.memoize_with_key(
-        lambda vote_count, total_votes: MemoizationAlgorithm.generate_hash_key(vote_count, total_votes)
-    )
+    @MemoizationAlgorithm.memoize_with_key()
     def calculate_vote_percentage(vote_count, total_votes):
         """
         Calculate vote percentage - memoized for repeated calculations
@@ -407,9 +405,7 @@ class VotingDataService:
         return round((vote_count / total_votes * 100), 2)
     
     @staticmethod
-    @MemoizationAlgorithm.memoize_with_key(
-        lambda voters, registered: MemoizationAlgorithm.generate_hash_key(voters, registered)
-    )
+    @MemoizationAlgorithm.memoize_with_key()
     def calculate_turnout_percentage(voters, registered):
         """
         Calculate turnout percentage - memoized for repeated calculations
@@ -427,9 +423,7 @@ class VotingDataService:
     
     @staticmethod
     @MemoizationAlgorithm.memoize_with_key(
-        lambda votes_data: MemoizationAlgorithm.generate_hash_key(
-            *[(v.get('candidate_id'), v.get('vote_count')) for v in votes_data]
-        )
+        lambda votes_data: tuple([(v.get('candidate_id'), v.get('vote_count')) for v in votes_data])
     )
     def aggregate_votes_by_candidate(votes_data):
         """